@@ -4,6 +4,7 @@ import colorsys
 from phue2 import Bridge, PhueRegistrationException
 import threading
 import random
+import httpx
 import ipdb
 
 hue_bridge_ip = '10.67.1.54'
@@ -13,10 +14,29 @@ sensor_pattern = 'bryggers'   # 'halloween'
 run_disco = True
 
 
+def make_http_client(pool_maxsize=4, timeout=10.0):
+    """Return a keep-alive HTTP client that several Bridge objects can share.
+
+    Reusing pooled connections avoids a TCP handshake per bridge request;
+    one retry covers keep-alive connections the bridge has already closed.
+    """
+    limits = httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize)
+    return httpx.Client(timeout=timeout, transport=httpx.HTTPTransport(retries=1, limits=limits))
+
+
+def _make_bridge(bridge_ip, http_client=None):
+    if http_client is not None:
+        try:
+            return Bridge(bridge_ip, http_client=http_client)
+        except TypeError:
+            pass  # phue2 release without http_client support
+    return Bridge(bridge_ip)
+
+
 class HueBridge:
-    def __init__(self, bridge_ip):
+    def __init__(self, bridge_ip, http_client=None):
         self.bridge_ip = bridge_ip
-        self.b = Bridge(bridge_ip)        
+        self.b = _make_bridge(bridge_ip, http_client)
 
 
 class HueLights:
@@ -35,10 +55,11 @@ class HueLights:
     disco_durations =  [1,2,3,4]   # in seconds
     disco_brightness = [0, 0, 0, 50, 50, 50, 100, 150]   # in seconds
 
-    def __init__(self, bridge_ip, light_pattern):
+    def __init__(self, bridge_ip, light_pattern, http_client=None):
         self.run_disco = False
+        self.disco_on = False
         self.bridge_ip = bridge_ip
-        self.b = Bridge(bridge_ip)
+        self.b = _make_bridge(bridge_ip, http_client)
                 
         # get lights
         lights = self.b.get_light_objects('name')
@@ -78,6 +99,7 @@ class HueLights:
         
         timer = threading.Timer(transitiontime/10., self.b.set_light, args=[self.lights_uids, self.commands['off']])
         timer.start()  # after 60 seconds, 'callback' will be called
+        return timer  # callers shutting down join it before closing the bridge
     
     def send_command(self, cmd=None, uids=None,  **kwargs):
         if uids is None:
@@ -143,9 +165,9 @@ class HueLights:
 
 
 class HueSensor:
-    def __init__(self, bridge_ip, sensor_pattern):
+    def __init__(self, bridge_ip, sensor_pattern, http_client=None):
         self.bridge_ip = bridge_ip
-        self.b = Bridge(bridge_ip)
+        self.b = _make_bridge(bridge_ip, http_client)
                 
         # get sensors and lights
         sensors = self.b.get_sensor_objects('name')
@@ -166,13 +188,56 @@ class HueSensor:
         self.refresh()
     
     def refresh(self):
-        self.sensor_state = self.b.get_sensor(sensor_id=self.sensor.sensor_id)['state']
+        self.update_state(self.b.get_sensor(sensor_id=self.sensor.sensor_id)['state'])
+
+    def update_state(self, state):
+        self.sensor_state = state
         self.presence = self.sensor_state.get('presence', False)
         self.updated = self.sensor_state['lastupdated']
 
     def has_presence(self):
         return self.sensor_state.get('presence', False)
-    
+
+
+class HueSensorGroup:
+    """Refreshes a set of HueSensor objects from a single bridge request.
+
+    The bridge returns every sensor in one GET on /api/<user>/sensors, so
+    polling N sensors costs one round-trip instead of N.
+    """
+    def __init__(self, sensors):
+        self.sensors = list(sensors)
+        # All sensors live on the same bridge; reuse the first one's connection
+        self.b = self.sensors[0].b if self.sensors else None
+        # CLIP v2 events reference v1 sensors as '/sensors/<id>'
+        self._by_v1_id = {f'/sensors/{s.sensor.sensor_id}': s for s in self.sensors}
+
+    def refresh_all(self):
+        if self.b is None:
+            return
+        all_sensors = self.b.get_sensor()
+        for s in self.sensors:
+            data = all_sensors.get(str(s.sensor.sensor_id))
+            if data is not None:
+                s.update_state(data['state'])
+
+    def any_presence(self):
+        return any(s.presence for s in self.sensors)
+
+    def apply_event(self, item):
+        """Apply one item from the bridge's CLIP v2 event stream.
+
+        Returns True if the item was a motion update for one of our sensors.
+        """
+        if item.get('type') != 'motion':
+            return False
+        sensor = self._by_v1_id.get(item.get('id_v1'))
+        motion = item.get('motion') or {}
+        if sensor is None or 'motion' not in motion:
+            return False
+        sensor.presence = bool(motion['motion'])
+        return True
+
 
 
 def main():
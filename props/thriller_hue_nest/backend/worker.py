@@ -2,21 +2,36 @@
 from __future__ import annotations
 import asyncio
 import json
+import logging
 import queue
 import time
 from abc import ABC, abstractmethod 
+import httpx
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 from typing import List
 
 from worker_host.base import BaseWorker
 
+log = logging.getLogger(__name__)
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional speed-up; fall back to the stdlib parser
+    _json_loads = json.loads
+
 # Import third-party libraries
 from .chromecast_API import *
 from .hue_API import *
 
 PROP_ID = "thriller_hue_nest"
 
+# The Hue event stream can be quiet for long stretches, but a connection that
+# stays silent this long (seconds) is treated as dead (half-open TCP, bridge
+# reboot without FIN) and reconnected, so polling resumes in between.
+HUE_STREAM_READ_TIMEOUT = 300.0
+
 
 # ============================ CONFIG MODEL ============================
 class ChromecastDevice(BaseModel):
@@ -36,6 +51,7 @@ class ConfigModel(BaseSettings):
     HUE_SPOT_LIGHT: str = "Halloween Spot"
     HUE_PLAYING_SCENE: str = "disco"  # Options: 'disco' or color name ('red', 'yellow', 'pink', 'purple', 'normal', etc.)
     TELEMETRY_INTERVAL: int = 10  # How often to send telemetry updates (seconds)
+    HUE_EVENTSTREAM: bool = True  # Track motion via the bridge's v2 event stream (falls back to polling)
     tick_interval: int = 5
 
     # Use BaseSettings' model_config to control env file behavior. Docker
@@ -178,7 +194,7 @@ class ArmingState(State):
         if context.cc_thriller_group.is_empty():
             print('No Thriller chromecast found, cannot play media.')
         else:
-            url_list = filter_url_list(context.config.CHROMECAST_THRILLER_GROUP)
+            url_list = context._thriller_urls
             # Prefer background loader which guarantees paused-on-ready
             if hasattr(context.cc_thriller_group, 'load_media_bg'):
                 try:
@@ -229,11 +245,11 @@ class WaitingState(State):
         if current_time - self.last_check_time > self.check_interval:
             context.cc_thriller_group.refresh()
             if context.cc_thriller_group.any_unknown():
-                print(f"{self.__class__.__name__}::Unknown chromecast state detected. Rearming...")
+                log.info("%s::Unknown chromecast state detected. Rearming...", self.__class__.__name__)
                 context.set_state(ArmingState)
                 return
             self.last_check_time = current_time
-            print(f"{self.__class__.__name__}::Checked chromecast state, all good!")
+            log.debug("%s::Checked chromecast state, all good!", self.__class__.__name__)
 
     def on_action(self, context, action, arg):
         """Handles user commands while waiting for motion."""
@@ -354,7 +370,7 @@ class PlayingState(State):
                 context.set_state(FadeOutState)
                 return 
         
-            print(f"{self.__class__.__name__}::Time since last motion: {current_time - self.last_motion_time:.1f} s")
+            log.debug("%s::Time since last motion: %.1f s", self.__class__.__name__, current_time - self.last_motion_time)
         
         if time.monotonic() - self.last_motion_time > 5:   # WAIT minimum 5 seconds before checking playing state
             if not context.cc_thriller_group.is_empty():
@@ -462,8 +478,11 @@ class HueManager:
 
         Args:
             transitiontime: The time in seconds for the lights to fade out.
+
+        Returns:
+            The timer that sends the final 'off', or None.
         """
-        self.lights.lights_off(transitiontime=transitiontime)
+        return self.lights.lights_off(transitiontime=transitiontime)
 
 
 # ======= Resiliency helpers: dummy subsystems used when hardware is unavailable ======
@@ -566,19 +585,20 @@ def filter_repeat_list(list_of_items):
     """Extract repeat flags from list of dicts or objects."""
     return [_get_field_from_item(it, 'repeat') for it in list_of_items]
 
-def connect_hue_lights(bridge_ip, light_name):
+def connect_hue_lights(bridge_ip, light_name, http_client=None):
     """
     Connects to the Hue bridge and returns a HueLights object.
 
     Args:
         bridge_ip: The IP address of the Hue bridge.
         light_name: The name of the light or group to control.
+        http_client: Optional shared keep-alive client for bridge requests.
 
     Returns:
         An initialized HueLights object.
     """
     print(f"connecting...")    
-    lights = HueLights(bridge_ip, light_name)
+    lights = HueLights(bridge_ip, light_name, http_client=http_client)
     print(f"sending command off...")
     lights.send_command('off')
     print(f"command off sent")
@@ -598,6 +618,24 @@ class Worker(BaseWorker):
 
     NAME = "thriller_hue_nest"
 
+    # do_hue() actions: action -> (HueManager method name, *args)
+    _HUE_ACTIONS = {
+        'disco': ('toggle_disco',),
+        'off': ('lights_off',),
+        'purple': ('send_command', 'purple'),
+        'red': ('send_command', 'red'),
+        'green': ('send_command', 'green'),
+        'blue': ('send_command', 'blue'),
+    }
+
+    # do_chromecast() actions that map directly onto a ChromecastGroup method
+    _CHROMECAST_ACTIONS = {
+        'stop': 'stop',
+        'volume_up': 'volume_up',
+        'volume_down': 'volume_down',
+        'fade_to_stop': 'fade_to_stop',
+    }
+
     def __init__(self, prop_id, mqtt_client, config: ConfigModel | None = None):
         """
         Initializes the worker, loading configuration and setting up state variables.
@@ -614,7 +652,9 @@ class Worker(BaseWorker):
         super().__init__(prop_id, mqtt_client, config)
         
         self.current_state = None # Will hold the state object instance
-        self.command_queue = queue.Queue() # Will hold incoming commands
+        # Will hold incoming commands; the poll loop awaits it so commands are
+        # handled as soon as they arrive rather than on the next tick.
+        self.command_queue: asyncio.Queue = asyncio.Queue()
 
         # State Machine Variables
         self.play_counter = 0
@@ -623,10 +663,21 @@ class Worker(BaseWorker):
         self.hue_lights = []
         self.hue_manager = _NullHueManager()  # Default to null manager
         self.motion_sensors = []
+        self.hue_sensor_group = HueSensorGroup([])
+        # Keep-alive HTTP client shared by all Hue bridge objects
+        self._hue_session = None
+        # True while the Hue event stream is connected; motion is then pushed
+        # into hue_sensor_group and the per-tick sensor poll is skipped.
+        self._hue_stream_live = False
         self.cc_thriller_group = _DummyChromecastGroup()  # Default to dummy group
-        # When set_state is called we set this flag; the sync thread will
-        # call the state's on_enter() exactly once before calling handle().
-        self._state_needs_enter = False
+        # set_state() sets this event; _enter_task() then runs the new state's
+        # on_enter() exactly once. handle() is skipped until that has happened.
+        self._state_change = asyncio.Event()
+        self._entered_state = None
+        self._loop = None
+        # Serialises the sync-thread work (on_enter vs. command/handle) so
+        # state code never runs concurrently in two threads.
+        self._sync_lock = asyncio.Lock()
         # Timer for periodic telemetry collection
         self.last_telemetry_time = time.monotonic()
         # Queue for telemetry work that must run in the sync thread
@@ -634,12 +685,25 @@ class Worker(BaseWorker):
         # run on the asyncio event loop). Use a Queue so both sync and async
         # callers can enqueue work safely.
         self._telemetry_queue = queue.Queue()
+        # Last value published per telemetry key, used by _telem_if_changed()
+        # to skip re-publishing values that have not changed.
+        self._last_telem = {}
         # Flag flipped while _run_sync_tasks is executing to allow
         # set_state() to perform telemetry immediately when called from
         # the sync thread.
         self._in_sync_thread = False
 
 
+    def _telem_if_changed(self, key, value, **kwargs):
+        """Publish telemetry only if `value` differs from the last one sent for `key`.
+
+        Use the plain `telemetry()` for values that must always be sent
+        (e.g. the `tick` heartbeat).
+        """
+        if self._last_telem.get(key) != value:
+            self._last_telem[key] = value
+            self.telemetry(key, value, **kwargs)
+
     # --- NEW: State Management Method ---
     def set_state(self, new_state_class):
         """
@@ -660,8 +724,9 @@ class Worker(BaseWorker):
         
         # Create an instance of the new state, passing self as the context
         self.current_state = new_state_class(self)
-        # Mark that the state's on_enter() needs to run in the sync thread
-        self._state_needs_enter = True
+        # Wake _enter_task; set_state() may be called from the sync thread
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._state_change.set)
 
         self.publish_state(state_name)
 
@@ -669,21 +734,22 @@ class Worker(BaseWorker):
     # --- NEW: Async Command Bridge ---
     async def do_command(self, action: str | None, arg: str | None):
         """
-        Receives a command from MQTT and puts it on the thread-safe queue.
+        Receives a command from MQTT and puts it on `command_queue`.
 
         This method serves as the bridge between the asynchronous MQTT message
-        handler and the synchronous state machine. It queues commands to be
-        processed by the main poll loop.
+        handler and the synchronous state machine. `command_queue` is an
+        `asyncio.Queue` filled with `put_nowait`, which is not thread-safe, so
+        this must be called from the event loop thread (BaseWorker.on_message
+        awaits it there). The main poll loop drains the queue.
 
         Args:
             action: The command action string (e.g., 'arm', 'stop').
             arg: An optional argument string for the command.
         """
         if action:
-            print(f"Queueing command: {action}({arg})")
-            self.command_queue.put((action, arg))
-            print(f"Queue size is now {self.command_queue.qsize()}")
-            print(f"Command queue contents: {list(self.command_queue.queue)}")
+            log.debug("Queueing command: %s(%s)", action, arg)
+            self.command_queue.put_nowait((action, arg))
+            log.debug("Queue size is now %d", self.command_queue.qsize())
 
     async def _init_integrations(self):
         """
@@ -696,6 +762,16 @@ class Worker(BaseWorker):
             True if all initializations succeed, False otherwise.
         """
         
+        # Needed before the first set_state() below can wake _enter_task
+        self._loop = asyncio.get_running_loop()
+
+        # Config is static for the worker's lifetime; coerce it once here
+        # rather than on every poll tick / command.
+        self._telemetry_interval = float(self.config.TELEMETRY_INTERVAL)
+        self._thriller_urls = filter_url_list(self.config.CHROMECAST_THRILLER_GROUP)
+        if self._hue_session is None:
+            self._hue_session = make_http_client()
+
         try:
             # Use to_thread for all blocking initializations
             await asyncio.to_thread(self._connect_blocking_services)
@@ -759,38 +835,43 @@ class Worker(BaseWorker):
         
         try:
             print('Connecting to Hue Lights...')
-            self.telemetry("hue/state", f"Connecting to Hue lights... (bridge: {self.config.HUE_BRIDGE_IP})")
-            self.hue_lights = connect_hue_lights(self.config.HUE_BRIDGE_IP, self.config.HUE_SPOT_LIGHT)
+            self._telem_if_changed("hue/state", f"Connecting to Hue lights... (bridge: {self.config.HUE_BRIDGE_IP})")
+            self.hue_lights = connect_hue_lights(self.config.HUE_BRIDGE_IP, self.config.HUE_SPOT_LIGHT,
+                                                 http_client=self._hue_session)
             self.hue_manager = HueManager(self.hue_lights)
             print(f"Connected to Hue lights: {self.hue_lights}")
             print(f"Connected to Hue lights: {self.hue_lights.lights}")
-            self.telemetry("hue/state", f"Connected to Hue lights: {self.config.HUE_SPOT_LIGHT}")
-            self.telemetry("hue/LightsCount", len(self.hue_lights), retain=True)
+            self._telem_if_changed("hue/state", f"Connected to Hue lights: {self.config.HUE_SPOT_LIGHT}")
+            self._telem_if_changed("hue/LightsCount", len(self.hue_lights), retain=True)
         except Exception as e:
             print(f"[thriller_hue_nest] Hue lights init failed: {e}. Continuing without lights.")
             # print the traceback for debugging
             import traceback
             traceback.print_exc()
         
-            self.telemetry("hue/state", f"Hue lights initialization failed: {e}")
-            self.telemetry("hue/LightsCount", 0, retain=True)
+            self._telem_if_changed("hue/state", f"Hue lights initialization failed: {e}")
+            self._telem_if_changed("hue/LightsCount", 0, retain=True)
             self.hue_manager = _NullHueManager()
             self.hue_lights = []
             exceptions_raised['lights'] = e
 
         try:
             print('Connecting to Hue Motion Sensors...')
-            self.telemetry("hue/state", "Connecting to Hue motion sensors...")
-            self.motion_sensors = [HueSensor(self.config.HUE_BRIDGE_IP, name) for name in self.config.MOTION_SENSORS]
-            self.telemetry("hue/state", f"Connected to {len(self.motion_sensors)} Hue motion sensors.")
-            self.telemetry("hue/SensorsCount", len(self.motion_sensors), retain=True)
+            self._telem_if_changed("hue/state", "Connecting to Hue motion sensors...")
+            self.motion_sensors = [HueSensor(self.config.HUE_BRIDGE_IP, name, http_client=self._hue_session)
+                                   for name in self.config.MOTION_SENSORS]
+            self._telem_if_changed("hue/state", f"Connected to {len(self.motion_sensors)} Hue motion sensors.")
+            self._telem_if_changed("hue/SensorsCount", len(self.motion_sensors), retain=True)
         except Exception as e:
             print(f"[thriller_hue_nest] Hue motion sensor init failed: {e}. Continuing without motion sensors.")
-            self.telemetry("hue/state", f"Hue motion sensor initialization failed: {e}")
-            self.telemetry("hue/SensorsCount", 0, retain=True)
+            self._telem_if_changed("hue/state", f"Hue motion sensor initialization failed: {e}")
+            self._telem_if_changed("hue/SensorsCount", 0, retain=True)
             self.motion_sensors = []
             exceptions_raised['sensors'] = e
 
+        # Poll all sensors with one bridge request per tick
+        self.hue_sensor_group = HueSensorGroup(self.motion_sensors)
+
         if exceptions_raised['lights'] is None or exceptions_raised['sensors'] is None:
             out_str = f"Connected; {len(self.motion_sensors)} motion sensors; {len(self.hue_lights)} lights."
         else:
@@ -798,7 +879,7 @@ class Worker(BaseWorker):
                 [f"{k}: {v}" for k, v in exceptions_raised.items() if v is not None]
             )
         print(out_str)
-        self.telemetry("hue/Status", out_str, retain=True)
+        self._telem_if_changed("hue/Status", out_str, retain=True)
 
     async def start(self) -> None:
         """
@@ -819,6 +900,13 @@ class Worker(BaseWorker):
         # Spawn ticker method
         self.spawn(self._ticker())
 
+        # Runs on_enter() as soon as a state transition is requested
+        self.spawn(self._enter_task())
+
+        # Push-based motion updates from the Hue bridge
+        if self.config.HUE_EVENTSTREAM:
+            self.spawn(self._hue_event_stream())
+
         # Spawn the async poll loop as a managed task
         self.spawn(self._poll_loop())
 
@@ -849,12 +937,20 @@ class Worker(BaseWorker):
         down services does not block the main loop.
         """
         print("Cleaning up resources...")
-        if hasattr(self, 'hue_manager'):
-            self.hue_manager.lights_off()
-            self.telemetry("hue/state", "Off", retain=True)
-        if hasattr(self, 'cc_thriller_group') and self.cc_thriller_group is not None:
+        off_timer = None
+        if self.hue_manager is not None:
+            off_timer = self.hue_manager.lights_off()
+            self._telem_if_changed("hue/state", "Off", retain=True)
+        if self.cc_thriller_group is not None:
             self.cc_thriller_group.stop()
-            self.telemetry("speakers/State", "Stopped", retain=True)
+            self._telem_if_changed("speakers/State", "Stopped", retain=True)
+        if off_timer is not None:
+            # The final 'off' goes through the shared session; let it finish
+            # before closing, or the lights stay at the dimmed level
+            off_timer.join(timeout=15)
+        if self._hue_session is not None:
+            self._hue_session.close()
+            self._hue_session = None
 
     async def _poll_loop(self):
         """
@@ -868,31 +964,60 @@ class Worker(BaseWorker):
         while True:
             # --- Process Command Queue ---
             try:
-                # Check for a command without blocking
-                # The queue contains (action, arg) tuples
-                action, arg = self.command_queue.get_nowait()
-            except queue.Empty:
+                # Wait up to one tick for a command; this doubles as the
+                # loop's pacing sleep. The queue contains (action, arg) tuples
+                action, arg = await asyncio.wait_for(self.command_queue.get(), timeout=0.2)
+            except asyncio.TimeoutError:
                 action = None
                 arg = None
 
-            if action is not None:
+            async with self._sync_lock:
+                if action is not None:
+                    try:
+                        self._handle_command(action, arg)
+                    except Exception as e:
+                        # Do not let command handler exceptions kill the poll loop
+                        self.telemetry("error", f"Command handler error: {e}")
+
+                # --- Run Synchronous, Blocking Code in a Thread ---
+                # This prevents your API calls (Hue, Tesla) from freezing the event loop.
                 try:
-                    self._handle_command(action, arg)
+                    await asyncio.to_thread(self._run_sync_tasks)
                 except Exception as e:
-                    # Do not let command handler exceptions kill the poll loop
-                    self.telemetry("error", f"Command handler error: {e}")
+                    # Log and continue; do not kill the main loop
+                    self.telemetry("error", f"_run_sync_tasks failed: {e}")
 
-            # --- Run Synchronous, Blocking Code in a Thread ---
-            # This prevents your API calls (Hue, Tesla) from freezing the event loop.
-            try:
-                await asyncio.to_thread(self._run_sync_tasks)
-            except Exception as e:
-                # Log and continue; do not kill the main loop
-                self.telemetry("error", f"_run_sync_tasks failed: {e}")
+    async def _enter_task(self):
+        """
+        Runs the current state's `on_enter` whenever `set_state` signals a
+        transition.
+
+        `on_enter` may block (media loading, Hue calls), so it runs in a
+        thread under the same lock as the poll loop's sync work.
+        """
+        while True:
+            await self._state_change.wait()
+            self._state_change.clear()
+            async with self._sync_lock:
+                try:
+                    await asyncio.to_thread(self._run_on_enter)
+                except Exception as e:
+                    self.telemetry("error", f"_run_on_enter failed: {e}")
+
+    def _run_on_enter(self):
+        """Calls `on_enter` once for the current state (sync thread)."""
+        state = self.current_state
+        if state is None or state is self._entered_state:
+            return
+        # Mark first so a failing on_enter is not retried on every wake-up
+        self._entered_state = state
+        try:
+            state.on_enter(self)
+            self._collect_and_send_telemetry()
+            self.last_telemetry_time = time.monotonic()  # Reset timer after state transition
+        except Exception as e:
+            self.telemetry("error", f"State on_enter error: {e}")
 
-            # Use the non-blocking sleep
-            await asyncio.sleep(0.2)
-            
 
     def _run_sync_tasks(self):
         """
@@ -903,52 +1028,92 @@ class Worker(BaseWorker):
         the motion sensors. It is designed to be called via `asyncio.to_thread`
         from the main async poll loop.
         """
+        tel = self.telemetry
+        mono = time.monotonic
 
-        # If a new state requires entry initialization, run it now (sync thread)
-        if getattr(self, '_state_needs_enter', False) and self.current_state is not None:
-            try:
-                self.current_state.on_enter(self)
-                self._collect_and_send_telemetry()
-                self.last_telemetry_time = time.monotonic()  # Reset timer after state transition
-            except Exception as e:
-                self.telemetry("error", f"State on_enter error: {e}")
-            finally:
-                self._state_needs_enter = False
-
-        # Delegate the main work to the current state's handle method
-        if self.current_state:
+        # Delegate the main work to the current state's handle method, once
+        # _enter_task has run its on_enter()
+        if self.current_state is not None and self.current_state is self._entered_state:
             try:
                 self.current_state.handle(self)
             except Exception as e:
-                self.telemetry("error", f"State handle error: {e}")
+                tel("error", f"State handle error: {e}")
 
         # Periodic telemetry collection
-        current_time = time.monotonic()
-        if current_time - self.last_telemetry_time > self.config.TELEMETRY_INTERVAL:
+        current_time = mono()
+        if current_time - self.last_telemetry_time > self._telemetry_interval:
             try:
                 self._collect_and_send_telemetry()
             except Exception as e:
-                self.telemetry("error", f"Telemetry collection error: {e}")
+                tel("error", f"Telemetry collection error: {e}")
             finally:
                 self.last_telemetry_time = current_time
 
         # Poll for motion and delegate
         motion_detected = False
-        for sensor in self.motion_sensors: # Corrected variable name from your __init__
+        if self.motion_sensors:
             try:
-                sensor.refresh()
+                # The event stream keeps presence current; only poll without it
+                if not self._hue_stream_live:
+                    self.hue_sensor_group.refresh_all()
+                motion_detected = self.hue_sensor_group.any_presence()
             except Exception as e:
-                self.telemetry("sensor/error", f"Sensor refresh failed: {e}")
-                continue
-            if getattr(sensor, 'presence', False):
-                motion_detected = True
-                break 
-        
+                tel("sensor/error", f"Sensor refresh failed: {e}")
+
+        # Same on_enter() gate as handle(): a state set by a command (or by
+        # handle() above) sees no motion until it has been entered
         if motion_detected:
-            if self.current_state:
-                self.current_state.on_motion(self)
+            state = self.current_state
+            if state is not None and state is self._entered_state:
+                state.on_motion(self)
 
 
+    async def _hue_event_stream(self):
+        """
+        Tracks motion sensor presence from the Hue bridge's SSE event stream.
+
+        While connected, motion events update `hue_sensor_group` directly and
+        `_run_sync_tasks` stops polling the bridge. On any failure, including
+        no data for HUE_STREAM_READ_TIMEOUT, the stream is marked down (so
+        polling resumes) and reconnected with backoff.
+        """
+        url = f"https://{self.config.HUE_BRIDGE_IP}/eventstream/clip/v2"
+        backoff = 1
+        while True:
+            bridge = self.hue_sensor_group.b
+            if bridge is None:
+                # No sensors connected (yet); check again later
+                await asyncio.sleep(5)
+                continue
+            headers = {"hue-application-key": bridge.username, "Accept": "text/event-stream"}
+            try:
+                # The bridge uses a self-signed certificate
+                async with httpx.AsyncClient(verify=False, timeout=httpx.Timeout(10.0, read=HUE_STREAM_READ_TIMEOUT)) as client:
+                    async with client.stream("GET", url, headers=headers) as resp:
+                        resp.raise_for_status()
+                        self._hue_stream_live = True
+                        backoff = 1
+                        async for line in resp.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            try:
+                                events = _json_loads(line[5:])
+                            except ValueError:
+                                continue
+                            for event in events:
+                                for item in event.get("data", ()):
+                                    self.hue_sensor_group.apply_event(item)
+            except asyncio.CancelledError:
+                raise
+            except httpx.ReadTimeout:
+                log.warning("Hue event stream silent for %.0fs; reconnecting", HUE_STREAM_READ_TIMEOUT)
+            except Exception as e:
+                self.telemetry("sensor/error", f"Hue event stream failed: {e}")
+            finally:
+                self._hue_stream_live = False
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+
     def _collect_and_send_telemetry(self):
         """
         Collect telemetry values that may block (chromecast.state(), tesla
@@ -959,20 +1124,20 @@ class Worker(BaseWorker):
         try:
             # Hue scene
             try:
-                hue_scene = "Disco" if getattr(self.hue_manager.lights, 'disco_on', False) else "Off"
+                hue_scene = "Disco" if self.hue_manager.lights.disco_on else "Off"
             except Exception:
                 hue_scene = "Unknown"
-            self.telemetry("hue/Scene", hue_scene, retain=True)
+            self._telem_if_changed("hue/Scene", hue_scene, retain=True)
 
             # Speaker/Chromecast player state (may block)
             try:
                 speaker_state = self.cc_thriller_group.state()
             except Exception:
                 speaker_state = "unknown"
-            self.telemetry("speakers/State", speaker_state, retain=True)
+            self._telem_if_changed("speakers/State", speaker_state, retain=True)
         except Exception as e:
             # Ensure telemetry collection doesn't raise in the sync thread
-            print(f"Telemetry collection failed: {e}")
+            log.warning("Telemetry collection failed: %s", e)
 
 
     def _handle_command(self, action: str, arg: str | None):
@@ -983,12 +1148,12 @@ class Worker(BaseWorker):
             action: The command action string.
             arg: An optional argument string for the command.
         """
-        print(f"Handling command: {action}({arg})")
+        log.debug("Handling command: %s(%s)", action, arg)
         if action and self.current_state and hasattr(self.current_state, 'on_action'):
             # Call the state's on_action method
             self.current_state.on_action(self, action, arg)
         else:
-            print(f"Warning: No handler for action '{action}' or state has no on_action method.")
+            log.warning("No handler for action '%s' or state has no on_action method.", action)
 
 
     async def _ticker(self):
@@ -1017,37 +1182,27 @@ class Worker(BaseWorker):
             arg: A string or dictionary specifying the Hue action to perform.
         """
         if self.hue_manager is None:
-            print("Hue manager instance is not available.")
+            log.warning("Hue manager instance is not available.")
             return
 
         if isinstance(arg, str):
             action = arg.lower()
-            match action:
-                case 'disco':
-                    self.hue_manager.toggle_disco()
-                case 'off':
-                    self.hue_manager.lights_off()
-                case 'purple':
-                    self.hue_manager.send_command('purple')
-                case 'red':
-                    self.hue_manager.send_command('red')
-                case 'green':
-                    self.hue_manager.send_command('green')
-                case 'blue':
-                    self.hue_manager.send_command('blue')
-                case 'connect':
-                    # call the _connect_hue method to reconnect
-                    await asyncio.to_thread(self._connect_hue)
-                case _:
-                    print(f"Unknown Hue action: {action}")
+            spec = self._HUE_ACTIONS.get(action)
+            if spec is not None:
+                getattr(self.hue_manager, spec[0])(*spec[1:])
+            elif action == 'connect':
+                # call the _connect_hue method to reconnect
+                await asyncio.to_thread(self._connect_hue)
+            else:
+                log.warning("Unknown Hue action: %s", action)
 
         elif isinstance(arg, dict):
             # Handle dictionary-based commands if needed
-            print("Dictionary-based Hue commands are not implemented.")
+            log.warning("Dictionary-based Hue commands are not implemented.")
         else:
-            print("Invalid argument for Hue command.")
+            log.warning("Invalid argument for Hue command.")
 
-        self.telemetry("hue/state", "Disco" if self.hue_manager.lights.disco_on else "Off", retain=True)
+        self._telem_if_changed("hue/state", "Disco" if self.hue_manager.lights.disco_on else "Off", retain=True)
 
     async def do_chromecast(self, arg: str | dict | None):
         """
@@ -1060,10 +1215,10 @@ class Worker(BaseWorker):
         # Try to parse JSON string to dict
         if isinstance(arg, str):
             try:
-                parsed = json.loads(arg)
+                parsed = _json_loads(arg)
                 if isinstance(parsed, dict):
                     arg = parsed
-            except (json.JSONDecodeError, ValueError):
+            except ValueError:  # json and orjson decode errors are ValueErrors
                 pass  # Keep as string if not valid JSON
         
         if isinstance(arg, str):
@@ -1074,80 +1229,64 @@ class Worker(BaseWorker):
                 return
         
         if self.cc_thriller_group is None or self.cc_thriller_group.is_empty():
-            print("Chromecast group is not available.")
+            log.warning("Chromecast group is not available.")
             return
 
-        print(f"do_chromecast called with arg: {arg}")
-
-        # Always refresh status first
-        await asyncio.to_thread(self.cc_thriller_group.refresh)
-        for cast in self.cc_thriller_group.chromecasts:
-            try:
-                print(f"Device: {cast.cast_info.friendly_name} at {cast.cast_info.host}: {cast.media_controller.status}")
-            except Exception as e:
-                print(f"Error updating status for {cast}")
-                print(f"Exception: {e}")
+        log.debug("do_chromecast called with arg: %s", arg)
 
         if isinstance(arg, str):
             action = arg.lower()
-            match action:
-                case 'play':
-                    url_list = filter_url_list(self.config.CHROMECAST_THRILLER_GROUP)
-                    # Prefer the non-blocking background loader which guarantees the
-                    # track is PAUSED when ready (unless autoplay=True). This avoids
-                    # the race between load_media() and a subsequent play() call.
-                    if hasattr(self.cc_thriller_group, 'load_media_bg'):
-                        try:
-                            task = self.cc_thriller_group.load_media_bg(url_list=url_list, autoplay=False)
-                            # Await the asyncio.Future bridge so we resume after
-                            # the group is ready (and paused) for playback.
-                            await task.as_future()
-                        except Exception as e:
-                            print(f"Chromecast background load failed: {e}")
-                            # Fallback to the legacy blocking load
-                            await asyncio.to_thread(self.cc_thriller_group.load_media, url_list=url_list)
-                    else:
-                        # Older / dummy groups may not implement the new API
+            method_name = self._CHROMECAST_ACTIONS.get(action)
+            if method_name is not None:
+                await asyncio.to_thread(getattr(self.cc_thriller_group, method_name))
+            elif action == 'play':
+                url_list = self._thriller_urls
+                # Prefer the non-blocking background loader which guarantees the
+                # track is PAUSED when ready (unless autoplay=True). This avoids
+                # the race between load_media() and a subsequent play() call.
+                if hasattr(self.cc_thriller_group, 'load_media_bg'):
+                    try:
+                        task = self.cc_thriller_group.load_media_bg(url_list=url_list, autoplay=False)
+                        # Await the asyncio.Future bridge so we resume after
+                        # the group is ready (and paused) for playback.
+                        await task.as_future()
+                    except Exception as e:
+                        log.warning("Chromecast background load failed: %s", e)
+                        # Fallback to the legacy blocking load
                         await asyncio.to_thread(self.cc_thriller_group.load_media, url_list=url_list)
+                else:
+                    # Older / dummy groups may not implement the new API
+                    await asyncio.to_thread(self.cc_thriller_group.load_media, url_list=url_list)
+
+                # wait a moment for status to update
+                await asyncio.sleep(1)
 
-                    # wait a moment for status to update
-                    await asyncio.sleep(1)
-
-                    # Now explicitly start playback
-                    await asyncio.to_thread(self.cc_thriller_group.play)
-
-                case 'stop':
-                    await asyncio.to_thread(self.cc_thriller_group.stop)
-                case 'volume_up':
-                    await asyncio.to_thread(self.cc_thriller_group.volume_up)
-                case 'volume_down':
-                    await asyncio.to_thread(self.cc_thriller_group.volume_down)
-                case 'fade_to_stop':
-                    await asyncio.to_thread(self.cc_thriller_group.fade_to_stop)
-                case 'connect':
-                    # call the _connect_chromecast method to reconnect
-                    await asyncio.to_thread(self._connect_chromecast)
-                case _:
-                    print(f"Unknown Chromecast action: {action}")
+                # Now explicitly start playback
+                await asyncio.to_thread(self.cc_thriller_group.play)
+            else:
+                log.warning("Unknown Chromecast action: %s", action)
         elif isinstance(arg, dict):
             # Handle dictionary-based commands (e.g., volume_set with volume parameter)
             if 'volume' in arg:
                 volume = float(arg['volume'])
-                print(f"Setting chromecast volume to {volume}")
+                log.info("Setting chromecast volume to %s", volume)
                 await asyncio.to_thread(self.cc_thriller_group.set_volume, volume)
             else:
-                print(f"Unknown dictionary-based Chromecast command: {arg}")
+                log.warning("Unknown dictionary-based Chromecast command: %s", arg)
         else:
-            print("Invalid argument for Chromecast command.")
+            log.warning("Invalid argument for Chromecast command.")
         
-        # Always refresh status first
+        # Refresh once after dispatch so the log and telemetry reflect the
+        # state the command produced.
         await asyncio.to_thread(self.cc_thriller_group.refresh)
-        for cast in self.cc_thriller_group.chromecasts:
-            try:
-                print(f"Device: {cast.cast_info.friendly_name} at {cast.cast_info.host}: {cast.media_controller.status}")
-            except Exception as e:
-                print(f"Error updating status for {cast}")
-                print(f"Exception: {e}")
+        if log.isEnabledFor(logging.DEBUG):
+            lines = []
+            for cast in self.cc_thriller_group.chromecasts:
+                try:
+                    lines.append(f"{cast.cast_info.friendly_name}@{cast.cast_info.host}: {cast.media_controller.status}")
+                except Exception as e:
+                    lines.append(f"{cast}: err: {e}")
+            log.debug("Chromecast status:\n%s", "\n".join(lines))
 
-        self.telemetry("speakers/State", self.cc_thriller_group.state(), retain=True)
+        self._telem_if_changed("speakers/State", self.cc_thriller_group.state(), retain=True)
                        
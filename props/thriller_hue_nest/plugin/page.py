@@ -3,12 +3,22 @@ Tesla/Hue/Nest Worker Dashboard Plugin
 
 Displays status and provides controls for the tesla_hue_nest worker.
 """
+import itertools
 import json
+from html import escape
 from dash import html, dcc, Input, Output, State
 
 # Import BasePlugin from the standalone plugin_base package
 from plugin_base import BasePlugin
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps  # returns bytes, which paho publishes as-is
+except ImportError:  # optional speed-up; fall back to the stdlib encoder
+    _json_dumps = json.dumps
+
+_NOWRAP = "width: 1%; white-space: nowrap"
+
 
 class Plugin(BasePlugin):
     """Class-based plugin for the Thriller/Hue/Nest worker."""
@@ -72,6 +82,15 @@ class Plugin(BasePlugin):
 
     def on_register(self, app, services):
         """Register callbacks and MQTT subscriptions."""
+        # Telemetry dict shared through the cache; created once so the MQTT
+        # handler can update it without a lookup (or lock) per message.
+        self._telem = self.cache.setdefault("thriller_telem", {})
+        # Bumped on every telemetry message; _render_telem reuses its last
+        # table while the version is unchanged.
+        self._telem_seq = itertools.count(1)
+        self._telem_version = 0
+        self._telem_rendered = None  # (version, component)
+
         # Subscribe to MQTT topics
         self.mqtt_subscribe(self.T_AVAIL, self._on_avail)
         self.mqtt_subscribe(self.T_STATE, self._on_state)
@@ -108,18 +127,20 @@ class Plugin(BasePlugin):
         )
         def _set_volume(_, volume):
             if volume is not None:
-                self.mqtt_publish(self.T_CMD, json.dumps({"action": "chromecast", "args": {"volume": float(volume)}}))
+                self.mqtt_publish(self.T_CMD, _json_dumps({"action": "chromecast", "args": {"volume": float(volume)}}))
             return 0
 
     def _register_button(self, app, button_id, command):
         """Helper to register a simple button callback that sends an MQTT command."""
+        # The command is fixed per button, so encode it once
+        payload = command if isinstance(command, str) else _json_dumps(command)
+
         @app.callback(
             Output(button_id, "n_clicks"),
             Input(button_id, "n_clicks"),
             prevent_initial_call=True,
         )
         def _handle_click(_):
-            payload = command if isinstance(command, str) else json.dumps(command)
             self.mqtt_publish(self.T_CMD, payload)
             return 0
 
@@ -131,32 +152,16 @@ class Plugin(BasePlugin):
         self.cache["thriller_state"] = payload.decode("utf-8", "replace")
 
     def _on_telem(self, topic, payload: bytes):
-        # Parse topic: halloween/thriller_hue_nest/telemetry/category/key or halloween/thriller_hue_nest/telemetry/key
-        parts = topic.split("/")
+        # Key is everything after "telemetry/": e.g. "tick" or "hue/Scene"
+        key = topic.split("/", 3)[-1]
         value = payload.decode("utf-8", "replace")
-        
-        with self.cache.locked() as backing:
-            if "thriller_telem" not in backing:
-                backing["thriller_telem"] = {}
-            
-            # If topic has category/key structure (e.g., hue/Scene, speakers/Status)
-            if len(parts) >= 5 and "/" in parts[-1]:
-                # Already has category prefix in the key
-                full_key = "/".join(parts[4:])  # Everything after telemetry/
-                backing["thriller_telem"][full_key] = value
-            elif len(parts) >= 5:
-                # Multi-part: category/key
-                category = parts[-2] if len(parts) > 4 else ""
-                key = parts[-1]
-                if category:
-                    full_key = f"{category}/{key}"
-                else:
-                    full_key = key
-                backing["thriller_telem"][full_key] = value
-            else:
-                # Single part key (e.g., tick)
-                key = parts[-1]
-                backing["thriller_telem"][key] = value
+        # Retained replays and unchanged readings are common; skip the store
+        # and keep the rendered table valid when nothing actually changed.
+        if self._telem.get(key) == value:
+            return
+        # Single-key dict stores are atomic, so no cache lock is needed here
+        self._telem[key] = value
+        self._telem_version = next(self._telem_seq)
 
     # --- Render Callbacks ---
     def _render_avail(self, _):
@@ -181,8 +186,19 @@ class Plugin(BasePlugin):
         return html.Span(state, className=f"badge bg-{color} text-white")
 
     def _render_telem(self, _):
-        """Render the telemetry table grouped by category."""
-        telem = self.cache.get("thriller_telem", {})
+        """Render the telemetry table, reusing the last one if nothing changed."""
+        version = self._telem_version
+        rendered = self._telem_rendered
+        if rendered is not None and rendered[0] == version:
+            return rendered[1]
+        component = self._build_telem_table()
+        self._telem_rendered = (version, component)
+        return component
+
+    def _build_telem_table(self):
+        """Build the telemetry table grouped by category."""
+        # Snapshot: the MQTT thread may add keys while we iterate
+        telem = dict(self.cache.get("thriller_telem") or {})
         if not telem:
             return html.Div("telemetry: —")
         
@@ -203,49 +219,21 @@ class Plugin(BasePlugin):
             else:
                 categories["other"][key] = value
         
-        # Build single table with rowspan for category labels
+        # Build single table with rowspan for category labels. The shape is
+        # fixed, so emit one HTML string rather than a tree of Dash components
+        # that would be allocated and JSON-serialised on every change.
         rows = []
-        
-        # Hue section
-        if categories["hue"]:
-            items = sorted(categories["hue"].items())
+        for category, label in (("hue", "Hue:"), ("speakers", "Speakers:"), ("other", "Other:")):
+            items = sorted(categories[category].items())
             for i, (key, value) in enumerate(items):
-                if i == 0:
-                    rows.append(html.Tr([
-                        html.Td(html.Strong("Hue:"), rowSpan=len(items), className="align-top", style={"width": "1%", "whiteSpace": "nowrap"}),
-                        html.Td(key, style={"width": "1%", "whiteSpace": "nowrap"}),
-                        html.Td(value)
-                    ]))
-                else:
-                    rows.append(html.Tr([html.Td(key, style={"width": "1%", "whiteSpace": "nowrap"}), html.Td(value)]))
-        
-        # Speakers section
-        if categories["speakers"]:
-            items = sorted(categories["speakers"].items())
-            for i, (key, value) in enumerate(items):
-                if i == 0:
-                    rows.append(html.Tr([
-                        html.Td(html.Strong("Speakers:"), rowSpan=len(items), className="align-top", style={"width": "1%", "whiteSpace": "nowrap"}),
-                        html.Td(key, style={"width": "1%", "whiteSpace": "nowrap"}),
-                        html.Td(value)
-                    ]))
-                else:
-                    rows.append(html.Tr([html.Td(key, style={"width": "1%", "whiteSpace": "nowrap"}), html.Td(value)]))
-        
-        # Other section
-        if categories["other"]:
-            items = sorted(categories["other"].items())
-            for i, (key, value) in enumerate(items):
-                if i == 0:
-                    rows.append(html.Tr([
-                        html.Td(html.Strong("Other:"), rowSpan=len(items), className="align-top", style={"width": "1%", "whiteSpace": "nowrap"}),
-                        html.Td(key, style={"width": "1%", "whiteSpace": "nowrap"}),
-                        html.Td(value)
-                    ]))
-                else:
-                    rows.append(html.Tr([html.Td(key, style={"width": "1%", "whiteSpace": "nowrap"}), html.Td(value)]))
+                head = (f'<td rowspan="{len(items)}" class="align-top" style="{_NOWRAP}"><strong>{label}</strong></td>'
+                        if i == 0 else "")
+                rows.append(f'<tr>{head}<td style="{_NOWRAP}">{escape(key)}</td><td>{escape(value)}</td></tr>')
         
         if not rows:
             return html.Div("telemetry: —")
         
-        return html.Table(className="table table-sm mb-0", style={"tableLayout": "auto"}, children=[html.Tbody(rows)])
+        return dcc.Markdown(
+            f'<table class="table table-sm mb-0" style="table-layout: auto"><tbody>{"".join(rows)}</tbody></table>',
+            dangerously_allow_html=True,
+        )
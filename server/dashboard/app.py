@@ -1,9 +1,12 @@
 # server/dashboard/app.py
+import gzip
 import os
-from dash import Dash, html, dcc
+from dash import Dash, html, dcc, Input, Output, State, no_update
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
+from flask import Response, request
 from mqtt_service import MQTTService
-from plugin_loader import discover_plugins
+from plugin_loader import discover_and_register
 import os
 import socket
 
@@ -14,6 +17,7 @@ MQTT_USER = os.getenv("MQTT_USER", "dashboard")
 # Safe fallback: allow MQTT_PW or MQTT_DASHBOARD_PW to be present in the container
 MQTT_PW   = os.getenv("MQTT_PW") or os.getenv("MQTT_DASHBOARD_PW", "")
 PORT      = int(os.getenv("DASHBOARD_PORT", "8050"))
+DEBUG     = os.getenv("DASHBOARD_DEBUG", "0") == "1"
 
 client_id = f"dashboard-{socket.gethostname()}-{os.getpid()}"
 
@@ -29,27 +33,52 @@ mqtt = MQTTService(
 mqtt.connect()
 CACHE = {}  # shared dict for plugins
 
-# Discover: builtins + external props
-PLUGINS = discover_plugins("/opt/props", "/app/builtin_plugins")
-
 # Dash app
 external_stylesheets = [dbc.themes.BOOTSTRAP]
 app = Dash(__name__, external_stylesheets=external_stylesheets)
 app.config.suppress_callback_exceptions = True 
 server = app.server
 
-# Separate zones
-topbar_items = [p["layout"]() for p in PLUGINS if p["zone"] == "topbar"]
-card_items   = [
-    dbc.Card(dbc.CardBody(p["layout"]()), className="shadow-sm mb-3")
-    for p in PLUGINS if p["zone"] == "card"
-]
+# Tick handlers: (component_id, props, fn). All of them are served by one
+# global-tick callback so each tick costs a single round-trip.
+TICK_HANDLERS = []
+
+def register_tick_handler(component_id, props, fn):
+    """Update `component_id`'s `props` (str or tuple) from `fn` on every tick.
+
+    `fn(n_intervals, *current)` receives the props' current values in this
+    browser and returns the new value (or a tuple, one per prop); return
+    `no_update` to leave a prop untouched.
+    """
+    if isinstance(props, str):
+        props = (props,)
+    TICK_HANDLERS.append((component_id, tuple(props), fn))
+
+# Shared services handed to every plugin
+SERVICES = {"mqtt": mqtt, "cache": CACHE, "app": app, "tick_id": "global-tick",
+            "register_tick_handler": register_tick_handler}
+
+# Discover builtins + external props and register their callbacks
+PLUGINS = discover_and_register(app, SERVICES, "/opt/props", "/app/builtin_plugins")
+
+
+# Separate zones in a single pass
+by_zone = {"topbar": [], "card": []}
+for p in PLUGINS:
+    by_zone.setdefault(p["zone"], []).append(p)
+
+def _wrap_card(p):
+    card = dbc.Card(dbc.CardBody(p["layout"]()), className="shadow-sm mb-3")
+    return html.Div(card, className="flex-shrink-0", style={"width": "min(550px, 90vw)"})
+
+topbar_items = tuple(p["layout"]() for p in by_zone["topbar"])
+card_items   = tuple(_wrap_card(p) for p in by_zone["card"])
 
 def navbar():
     return dbc.Navbar(
         dbc.Container([
             html.Span("🎃 Halloween Dashboard", className="navbar-brand mb-0 h1"),
-            html.Div(id="topbar-widgets", className="d-flex gap-2 ms-auto", children=topbar_items),
+            html.Div(id="topbar-widgets", className="d-flex gap-2 ms-auto", children=list(topbar_items)),
         ]),
         color="dark", dark=True, className="mb-3"
     )
@@ -58,13 +87,12 @@ app.layout = dbc.Container([
     navbar(),
     # Global tick that plugins can use if they need a steady refresh
     dcc.Interval(id="global-tick", interval=1000, n_intervals=0),
+    # Whether this browser tab is visible; hidden tabs pause global-tick
+    dcc.Store(id="tab-visible", data=True),
     html.Div(
         className="d-flex flex-nowrap overflow-auto gap-3",
         id="cards-area", 
-        children=[
-            html.Div(card, className="flex-shrink-0", style={"width": "min(550px, 90vw)"})
-            for card in card_items
-        ],
+        children=list(card_items),
         style={
             "height": "calc(100vh - 80px)",  # Full viewport height minus navbar
             "overflowY": "auto",              # Allow vertical scroll within cards area
@@ -73,13 +101,72 @@ app.layout = dbc.Container([
     ),
 ], fluid=True, style={"height": "100vh", "overflow": "hidden"})
 
-# Register plugin callbacks with shared services
-SERVICES = {"mqtt": mqtt, "cache": CACHE, "app": app, "tick_id": "global-tick"}
-for p in PLUGINS:
-    try:
-        p["register"](app, SERVICES)
-    except Exception as e:
-        print(f"[plugin:{p['name']}] register_callbacks failed: {e}")
+if TICK_HANDLERS:
+    @app.callback(
+        [Output(cid, prop) for cid, props, _ in TICK_HANDLERS for prop in props],
+        Input("global-tick", "n_intervals"),
+        [State(cid, prop) for cid, props, _ in TICK_HANDLERS for prop in props],
+    )
+    def _tick_fanout(n, *current):
+        out = []
+        i = 0
+        for cid, props, fn in TICK_HANDLERS:
+            k = len(props)
+            # one failing handler must not block the others
+            try:
+                res = fn(n, *current[i:i + k])
+            except PreventUpdate:
+                res = (no_update,) * k
+            except Exception as e:
+                print(f"[tick:{cid}] handler failed: {e}")
+                res = (no_update,) * k
+            if k == 1:
+                out.append(res)
+            else:
+                out.extend(res)
+            i += k
+        return out
+
+# Pause global-tick while the tab is hidden so backgrounded dashboards cost
+# the server nothing; runs once on page load to install the listener.
+app.clientside_callback(
+    """
+    function(_) {
+        if (!window._tickVisibilityHooked) {
+            window._tickVisibilityHooked = true;
+            document.addEventListener("visibilitychange", function () {
+                window.dash_clientside.set_props("global-tick", {disabled: document.hidden});
+                window.dash_clientside.set_props("tab-visible", {data: !document.hidden});
+            });
+        }
+        return !document.hidden;
+    }
+    """,
+    Output("tab-visible", "data"),
+    Input("global-tick", "id"),
+)
+
+# The layout is static once plugins are loaded: serialise (and gzip) it once
+# and serve those bytes for every page load. Skipped in debug so edits to the
+# layout are picked up without a restart.
+if not DEBUG:
+    _LAYOUT_PATH = app.config.routes_pathname_prefix + "_dash-layout"
+    _layout_cache = {}
+
+    @server.before_request
+    def _serve_cached_layout():
+        if request.path != _LAYOUT_PATH:
+            return None
+        if not _layout_cache:
+            body = app.serve_layout().get_data()
+            _layout_cache["gzip"] = gzip.compress(body)
+            _layout_cache["raw"] = body
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            resp = Response(_layout_cache["gzip"], mimetype="application/json")
+            resp.headers["Content-Encoding"] = "gzip"
+            resp.headers["Vary"] = "Accept-Encoding"
+            return resp
+        return Response(_layout_cache["raw"], mimetype="application/json")
 
 def _on_exit():
     mqtt.disconnect()
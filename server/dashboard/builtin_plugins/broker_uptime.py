@@ -1,5 +1,5 @@
 # server/dashboard/builtin_plugins/broker_uptime.py
-from dash import html, Input, Output
+from dash import html, no_update
 
 name = "Broker Uptime"
 zone = "topbar"
@@ -7,26 +7,26 @@ zone = "topbar"
 BADGE_ID = "uptime-badge"
 TOPIC = "halloween/broker/uptime"  # you said Mosquitto publishes this
 
+_CLS_OK = "badge bg-success"
+_CLS_IDLE = "badge bg-secondary"
+
 def layout():
     # Single element with fixed id; we'll only change its text and className
-    return html.Span("Broker: —", id=BADGE_ID, className="badge bg-secondary")
+    return html.Span("Broker: —", id=BADGE_ID, className=_CLS_IDLE)
 
 def register_callbacks(app, services):
     mqtt  = services["mqtt"]
     cache = services["cache"]
-    tick  = services["tick_id"]  # "global-tick"
 
     def _on_uptime(topic, payload: bytes):
         cache["broker_uptime_raw"] = payload.decode("utf-8", errors="replace")
 
-    mqtt.subscribe(TOPIC, _on_uptime)
+    # Only the latest uptime matters; collapse bursts
+    mqtt.subscribe(TOPIC, _on_uptime, coalesce=True)
 
-    @app.callback(
-        Output(BADGE_ID, "children"),
-        Output(BADGE_ID, "className"),
-        Input(tick, "n_intervals"),
-    )
-    def _render(_):
+    # `shown` is what this browser currently displays, so unchanged ticks
+    # send nothing
+    def _render(_, shown, _shown_cls):
         val = cache.get("broker_uptime_raw", "—")
         # Try to format seconds as HH:MM:SS if possible
         try:
@@ -38,5 +38,9 @@ def register_callbacks(app, services):
             # keep val as-is if it's already a string like "1d 2h 3m"
             pass
         # Return ONLY text for children, and optionally adjust color
-        color = "success" if val != "—" else "secondary"
-        return f"Broker: {val}", f"badge bg-{color}"
+        text = f"Broker: {val}"
+        if text == shown:
+            return no_update, no_update
+        return text, (_CLS_OK if val != "—" else _CLS_IDLE)
+
+    services["register_tick_handler"](BADGE_ID, ("children", "className"), _render)
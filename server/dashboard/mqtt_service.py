@@ -1,14 +1,21 @@
 # server/dashboard/mqtt_service.py
 import os
 import json
+import queue
 import ssl
 import threading
-from collections import defaultdict
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import paho.mqtt.client as mqtt
 
+try:
+    import orjson
+    _dumps = orjson.dumps  # compact bytes, which paho publishes as-is
+except ImportError:  # optional speed-up; fall back to the stdlib encoder
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 
 # ---- Types -----------------------------------------------------------------
 
@@ -31,37 +38,99 @@ class WillConfig:
     retain: bool = False
 
 
-# ---- Helper: MQTT topic filter match (+ / #) --------------------------------
+# ---- Helper: coalescing callback wrapper -----------------------------------
 
-def _topic_matches(filter_str: str, topic: str) -> bool:
-    """
-    Minimal MQTT topic match supporting '+' (single level) and '#' (multi-level).
+class _Coalesced:
+    """Callback wrapper that delivers only the latest payload per topic.
+
+    _on_message offers every payload; only the first one for a topic that
+    is not already pending gets queued for dispatch. When the dispatcher
+    runs it, the newest payload for that topic is delivered, so a burst on
+    one topic collapses into a single callback.
     """
-    if filter_str == topic:
-        return True
+    __slots__ = ("cb", "_pending", "_lock")
 
-    f_levels = filter_str.split('/')
-    t_levels = topic.split('/')
+    def __init__(self, cb: OnMessage):
+        self.cb = cb
+        self._pending: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
 
-    i = 0
-    for i in range(len(f_levels)):
-        f = f_levels[i]
+    def offer(self, topic: str, payload: bytes) -> bool:
+        """Store `payload`; True if the caller must queue a dispatch."""
+        with self._lock:
+            fresh = topic not in self._pending
+            self._pending[topic] = payload
+            return fresh
 
-        # Multi-level wildcard (#) must be last in filter
-        if f == '#':
-            return i == len(f_levels) - 1
+    def __call__(self, topic: str, _payload: bytes):
+        with self._lock:
+            payload = self._pending.pop(topic, _payload)
+        self.cb(topic, payload)
 
-        if i >= len(t_levels):
-            return False
 
-        if f == '+':
-            continue  # matches exactly one level
+# ---- Helper: topic router (+ / #) ------------------------------------------
 
-        if f != t_levels[i]:
-            return False
+class _TrieNode:
+    """One topic level of the subscription trie."""
+    __slots__ = ("children", "plus", "hash_handlers", "handlers")
 
-    # All filter levels consumed: match only if topic has no extra levels
-    return len(t_levels) == len(f_levels)
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.plus: Optional["_TrieNode"] = None      # '+' child
+        self.hash_handlers: tuple = ()               # filters ending in '#' here
+        self.handlers: tuple = ()                    # filters ending exactly here
+
+
+def _build_trie(subs: Dict[str, List[OnMessage]], levels: Dict[str, Tuple[str, ...]]) -> _TrieNode:
+    """Build an immutable-by-convention trie from filter -> callbacks.
+
+    `levels` holds each filter already split on '/'.
+    """
+    root = _TrieNode()
+    for topic_filter, callbacks in subs.items():
+        node = root
+        for level in levels[topic_filter]:
+            if level == '#':
+                # Multi-level wildcard must be last; it also matches the parent level
+                node.hash_handlers += tuple(callbacks)
+                break
+            if level == '+':
+                if node.plus is None:
+                    node.plus = _TrieNode()
+                node = node.plus
+            else:
+                child = node.children.get(level)
+                if child is None:
+                    child = node.children[level] = _TrieNode()
+                node = child
+        else:
+            node.handlers += tuple(callbacks)
+    return root
+
+
+def _match(root: _TrieNode, levels: List[str]) -> Tuple[OnMessage, ...]:
+    """Collect the callbacks of every filter matching the split topic.
+
+    Usually a single trie node matches; its handler tuple is returned as-is
+    without building a new collection.
+    """
+    found: Tuple[OnMessage, ...] = ()
+    n = len(levels)
+    stack = [(root, 0)]
+    while stack:
+        node, i = stack.pop()
+        if node.hash_handlers:
+            found = found + node.hash_handlers if found else node.hash_handlers
+        if i == n:
+            if node.handlers:
+                found = found + node.handlers if found else node.handlers
+            continue
+        child = node.children.get(levels[i])
+        if child is not None:
+            stack.append((child, i + 1))
+        if node.plus is not None:
+            stack.append((node.plus, i + 1))
+    return found
 
 
 # ---- Service ---------------------------------------------------------------
@@ -71,6 +140,7 @@ class MQTTService:
     Thin, thread-safe wrapper over paho-mqtt:
       - single client with loop_forever() in a daemon thread
       - multiple callbacks per subscription filter (topic or wildcard)
+      - callbacks run on dispatch threads, off the paho network thread
       - re-subscribes on reconnect
     """
 
@@ -115,13 +185,34 @@ class MQTTService:
         self._debug = os.getenv("DASHBOARD_DEBUG", "0") == "1"
         self._client.on_log = self._on_log if self._debug else None
 
-        # Subscriptions: filter -> list[callback]
-        self._subs: Dict[str, List[OnMessage]] = defaultdict(list)
-
-        self._lock = threading.RLock()
+        # Subscriptions: filter -> list[callback]. _root is a trie rebuilt
+        # from _subs on every change and swapped in with one assignment, so
+        # the message thread reads it without taking the lock.
+        self._subs: Dict[str, List[OnMessage]] = {}
+        # Filters are immutable, so split each one once at subscribe time
+        self._filter_levels: Dict[str, Tuple[str, ...]] = {}
+        self._root = _TrieNode()
+        # Set once any subscription asks for coalescing; keeps the check off
+        # the message path otherwise
+        self._any_coalesce = False
+
+        # Filters subscribed while connected, flushed as one SUBSCRIBE packet
+        # shortly after the last subscribe() call (filter -> qos)
+        self._pending_subs: Dict[str, int] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # Guards _subs / _pending_subs mutations only
+        self._lock = threading.Lock()
         self._connected_evt = threading.Event()
         self._loop_thread: Optional[threading.Thread] = None
 
+        # Dispatch queues, one per worker thread. A topic always hashes to the
+        # same queue so its messages stay in order; 0 workers runs callbacks
+        # inline on the paho thread.
+        workers = max(int(os.getenv("MQTT_DISPATCH_WORKERS", "2")), 0)
+        self._dispatch_qs: List[queue.SimpleQueue] = [queue.SimpleQueue() for _ in range(workers)]
+        self._dispatch_threads: List[threading.Thread] = []
+
     # -- Lifecycle -----------------------------------------------------------
 
     def connect(self, wait_timeout: float = 10.0):
@@ -131,6 +222,13 @@ class MQTTService:
             self._client.connect(self._host, self._port, self._keepalive)
             self._client.loop_forever(retry_first_connection=True)
 
+        self._dispatch_threads = [
+            threading.Thread(target=self._dispatch_loop, args=(q,), name=f"mqtt-disp-{i}", daemon=True)
+            for i, q in enumerate(self._dispatch_qs)
+        ]
+        for t in self._dispatch_threads:
+            t.start()
+
         self._loop_thread = threading.Thread(target=_loop, name="mqtt-loop", daemon=True)
         self._loop_thread.start()
         self._connected_evt.wait(timeout=wait_timeout)
@@ -140,19 +238,45 @@ class MQTTService:
             self._client.disconnect()
         except Exception:
             pass
+        # Let dispatch threads finish what is queued, then exit
+        for q in self._dispatch_qs:
+            q.put(None)
 
     # -- Pub/Sub ------------------------------------------------------------
 
-    def subscribe(self, topic_filter: str, callback: OnMessage, qos: int = 0):
+    def subscribe(self, topic_filter: str, callback: OnMessage, qos: int = 0, coalesce: bool = False):
         """
         Register a callback for a topic filter (may include '+' or '#').
         Multiple callbacks per filter are allowed.
+
+        With `coalesce=True` messages that arrive on the same topic while an
+        earlier one is still waiting for dispatch are collapsed, and the
+        callback sees only the latest payload. Use it for handlers that just
+        store the current value (e.g. into the cache).
         """
+        if coalesce:
+            callback = _Coalesced(callback)
+            self._any_coalesce = True
         with self._lock:
-            self._subs[topic_filter].append(callback)
+            if topic_filter not in self._filter_levels:
+                self._filter_levels[topic_filter] = tuple(topic_filter.split('/'))
+            self._subs.setdefault(topic_filter, []).append(callback)
+            self._root = _build_trie(self._subs, self._filter_levels)
             if self._connected_evt.is_set():
-                # Subscribe (idempotent from the broker perspective)
-                self._client.subscribe(topic_filter, qos=qos)
+                # Subscribe (idempotent from the broker perspective); plugins
+                # subscribe in bursts at startup, so batch them
+                self._pending_subs[topic_filter] = qos
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(0.01, self._flush_subscribes)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+
+    def _flush_subscribes(self):
+        with self._lock:
+            pending, self._pending_subs = self._pending_subs, {}
+            self._flush_timer = None
+            if pending and self._connected_evt.is_set():
+                self._client.subscribe(list(pending.items()))
 
     def unsubscribe(self, topic_filter: str, callback: Optional[OnMessage] = None):
         """Remove a callback for a filter, or the entire filter if callback is None."""
@@ -161,24 +285,35 @@ class MQTTService:
                 return
             if callback is None:
                 del self._subs[topic_filter]
+                del self._filter_levels[topic_filter]
+                self._pending_subs.pop(topic_filter, None)
                 if self._connected_evt.is_set():
                     self._client.unsubscribe(topic_filter)
             else:
                 lst = self._subs[topic_filter]
-                try:
-                    lst.remove(callback)
-                except ValueError:
-                    pass
+                for i, cb in enumerate(lst):
+                    if cb is callback or (isinstance(cb, _Coalesced) and cb.cb is callback):
+                        del lst[i]
+                        break
                 if not lst:
                     del self._subs[topic_filter]
+                    del self._filter_levels[topic_filter]
+                    self._pending_subs.pop(topic_filter, None)
                     if self._connected_evt.is_set():
                         self._client.unsubscribe(topic_filter)
+            self._root = _build_trie(self._subs, self._filter_levels)
+
+    def has_subscriber(self, topic: str) -> bool:
+        """Cheap pre-check on the first topic level: False means no
+        subscription can match `topic`; True means one might."""
+        root = self._root
+        return bool(root.hash_handlers) or root.plus is not None or topic.partition('/')[0] in root.children
 
     def publish(self, topic: str, payload: bytes | str, qos: int = 0, retain: bool = False):
         self._client.publish(topic, payload=payload, qos=qos, retain=retain)
 
     def publish_json(self, topic: str, obj, qos: int = 0, retain: bool = False):
-        self.publish(topic, json.dumps(obj, separators=(",", ":")), qos=qos, retain=retain)
+        self.publish(topic, _dumps(obj), qos=qos, retain=retain)
 
     # -- paho callbacks ------------------------------------------------------
 
@@ -187,12 +322,15 @@ class MQTTService:
             print(f"[MQTTService] on_connect rc={rc}")
         if rc == mqtt.MQTT_ERR_SUCCESS or rc == 0:
             self._connected_evt.set()
-            # Re-subscribe all known filters
+            # Re-subscribe all known filters in a single SUBSCRIBE packet;
+            # this also covers anything still waiting in _pending_subs
             with self._lock:
-                for f in self._subs.keys():
+                filters = [(f, 0) for f in self._subs]
+                self._pending_subs.clear()
+                if filters:
                     if self._debug:
-                        print(f"[MQTTService] (re)subscribe: {f}")
-                    client.subscribe(f, qos=0)
+                        print(f"[MQTTService] (re)subscribe: {', '.join(f for f, _ in filters)}")
+                    client.subscribe(filters)
         else:
             # connection failed; leave event unset so callers can detect
             pass
@@ -204,24 +342,49 @@ class MQTTService:
         self._connected_evt.clear()
 
     def _on_message(self, client, userdata, msg):
-        # Collect relevant handlers by matching the message topic against each filter.
-        if self._debug:
-            print(f"[MQTTService] msg on {msg.topic} -> {msg.payload[:64]!r}")
-
-        to_call: List[OnMessage] = []
-        with self._lock:
-            for f, handlers in self._subs.items():
-                if _topic_matches(f, msg.topic):
-                    to_call.extend(handlers)
+        topic = msg.topic
+        # Most unmatched messages are rejected here by one dict lookup,
+        # before the topic is split or the payload touched.
+        if not self.has_subscriber(topic):
+            return
 
+        # Collect relevant handlers by walking the current trie snapshot.
+        to_call = _match(self._root, topic.split('/'))
         if not to_call:
             return
 
-        for cb in to_call:
+        if self._debug:
+            print(f"[MQTTService] msg on {topic} -> {msg.payload[:64]!r}")
+
+        payload = msg.payload
+        if self._any_coalesce:
+            # Drop coalescing callbacks that already have this topic queued
+            to_call = [cb for cb in to_call if not isinstance(cb, _Coalesced) or cb.offer(topic, payload)]
+            if not to_call:
+                return
+
+        qs = self._dispatch_qs
+        if qs:
+            qs[hash(topic) % len(qs)].put((topic, payload, to_call))
+        else:
+            self._invoke(topic, payload, to_call)
+
+    # -- Dispatch ------------------------------------------------------------
+
+    def _dispatch_loop(self, q: queue.SimpleQueue):
+        get = q.get
+        while True:
+            item = get()
+            if item is None:
+                return
+            self._invoke(*item)
+
+    def _invoke(self, topic: str, payload: bytes, handlers: Sequence[OnMessage]):
+        for cb in handlers:
             try:
-                cb(msg.topic, msg.payload)
+                cb(topic, payload)
             except Exception as e:
-                print(f"[MQTTService] callback error on {msg.topic}: {e}")
+                print(f"[MQTTService] callback error on {topic}: {e}")
 
     def _on_log(self, client, userdata, level, buf):
         if self._debug:
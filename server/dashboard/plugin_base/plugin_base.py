@@ -18,66 +18,68 @@ class SafeCache(MutableMapping):
 
     This implements the MutableMapping protocol so plugins can use the
     familiar dict syntax (e.g. `self.cache[key] = value`) while still
-    getting thread-safe access via an internal RLock. The class also
-    exposes the legacy helpers `get`, `set`, `pop`, and `as_dict` for
-    backward compatibility.
+    getting thread-safe access. The class also exposes the legacy helpers
+    `get`, `set`, `pop`, and `as_dict` for backward compatibility.
 
     Notes/caveats:
-    - The wrapper acquires the lock for each individual mapping operation.
-      If you need to perform a compound read-modify-write atomically,
-      consider adding a helper on the host side or using `as_dict()` and
-      performing your own locking strategy.
+    - Single-key reads (`[]`, `get`, `in`, `len`) take no lock; they rely on
+      CPython dict operations being atomic. Writes take one of a set of
+      striped locks chosen by key, so writers to different keys rarely
+      contend.
+    - For a compound read-modify-write use `transaction()`, which holds all
+      stripes and so excludes every writer (readers are not blocked).
     - The backing mapping may be any dict-like object provided by the
       application (often a simple dict). We copy on `as_dict()` to avoid
-      exposing internal state while the lock is released.
+      exposing internal state.
     """
 
+    _STRIPES = 16  # power of two, see _stripe()
+
     def __init__(self, backing: Dict[str, Any]) -> None:
-        self._lock = threading.RLock()
+        # RLocks so writes made inside transaction() by the same thread
+        # through the wrapper do not deadlock
+        self._stripes = tuple(threading.RLock() for _ in range(self._STRIPES))
         self._backing = backing
 
+    def _stripe(self, key: object) -> threading.RLock:
+        return self._stripes[hash(key) & (self._STRIPES - 1)]
+
     # MutableMapping interface -------------------------------------------------
     def __getitem__(self, key: str) -> Any:
-        with self._lock:
-            return self._backing[key]
+        return self._backing[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        with self._lock:
+        with self._stripe(key):
             self._backing[key] = value
 
     def __delitem__(self, key: str) -> None:
-        with self._lock:
+        with self._stripe(key):
             del self._backing[key]
 
     def __iter__(self) -> Iterator[str]:
-        with self._lock:
-            # iterate over a snapshot to avoid race conditions
-            return iter(list(self._backing.keys()))
+        # iterate over a snapshot to avoid race conditions
+        return iter(list(self._backing))
 
     def __len__(self) -> int:
-        with self._lock:
-            return len(self._backing)
+        return len(self._backing)
 
     def __contains__(self, key: object) -> bool:
-        with self._lock:
-            return key in self._backing
+        return key in self._backing
 
     # Backwards-compatible helpers ---------------------------------------------
     def get(self, key: str, default: Any = None) -> Any:
-        with self._lock:
-            return self._backing.get(key, default)
+        return self._backing.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        with self._lock:
+        with self._stripe(key):
             self._backing[key] = value
 
     def pop(self, key: str, default: Any = None) -> Any:
-        with self._lock:
+        with self._stripe(key):
             return self._backing.pop(key, default)
 
     def as_dict(self) -> Dict[str, Any]:
-        with self._lock:
-            return dict(self._backing)
+        return dict(self._backing)
 
     def transaction(self):
         """Return a context manager that yields the backing mapping while
@@ -89,8 +91,8 @@ class SafeCache(MutableMapping):
             with self.cache.transaction() as backing:
                 backing['counter'] = backing.get('counter', 0) + 1
 
-        The context manager acquires the RLock on enter and releases it on
-        exit. The object yielded is the raw backing mapping (not a copy), so
+        The context manager acquires every stripe lock on enter (always in
+        the same order) and releases them on exit. The object yielded is the raw backing mapping (not a copy), so
         be careful to keep operations bounded and avoid long-running work
         while holding the lock.
         """
@@ -100,11 +102,13 @@ class SafeCache(MutableMapping):
                 self._cache = cache
 
             def __enter__(self):
-                self._cache._lock.acquire()
+                for lock in self._cache._stripes:
+                    lock.acquire()
                 return self._cache._backing
 
             def __exit__(self, exc_type, exc, tb):
-                self._cache._lock.release()
+                for lock in reversed(self._cache._stripes):
+                    lock.release()
                 return False
 
         return _Tx(self)
@@ -129,6 +133,8 @@ class BasePlugin(ABC):
     your on_register.
     """
 
+    __slots__ = ("_services", "_mqtt", "_tick", "_cache", "cache")
+
     def register(self, app, services: Dict[str, Any]) -> None:
         """Called by the loader. Binds services to the instance and wraps the cache.
         """
@@ -149,36 +155,38 @@ class BasePlugin(ABC):
         # SafeCache ensures thread-safe access.
         self.cache = self._cache
 
-        # convenience helpers bound to the instance for backward compatibility
-        self.cache_get = self._cache.get
-        self.cache_set = self._cache.set
-        self.cache_pop = self._cache.pop
-
-        # mqtt helpers - no-ops if mqtt not available
-        def _publish(topic, payload, **kwargs):
-            if self._mqtt:
-                try:
-                    print(f"[plugin:{self.__class__.__name__}] Publishing to {topic}: {payload}")
-                    return self._mqtt.publish(topic, payload, **kwargs)
-                except Exception:
-                    # don't let a publishing error break plugin registration
-                    return None
-            return None
-
-        def _subscribe(topic, cb):
-            if self._mqtt:
-                try:
-                    return self._mqtt.subscribe(topic, cb)
-                except Exception:
-                    return None
-            return None
-
-        self.mqtt_publish = _publish
-        self.mqtt_subscribe = _subscribe
-
         # call subclass hook
         return self.on_register(app, services)
 
+    # convenience helpers kept for backward compatibility
+    def cache_get(self, key: str, default: Any = None) -> Any:
+        return self._cache.get(key, default)
+
+    def cache_set(self, key: str, value: Any) -> None:
+        self._cache.set(key, value)
+
+    def cache_pop(self, key: str, default: Any = None) -> Any:
+        return self._cache.pop(key, default)
+
+    # mqtt helpers - no-ops if mqtt not available
+    def mqtt_publish(self, topic, payload, **kwargs):
+        if self._mqtt:
+            try:
+                print(f"[plugin:{self.__class__.__name__}] Publishing to {topic}: {payload}")
+                return self._mqtt.publish(topic, payload, **kwargs)
+            except Exception:
+                # don't let a publishing error break plugin registration
+                return None
+        return None
+
+    def mqtt_subscribe(self, topic, cb, **kwargs):
+        if self._mqtt:
+            try:
+                return self._mqtt.subscribe(topic, cb, **kwargs)
+            except Exception:
+                return None
+        return None
+
     @abstractmethod
     def on_register(self, app, services: Dict[str, Any]) -> None:
         """Subclass should register callbacks and subscriptions here."""
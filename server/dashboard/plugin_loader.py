@@ -1,11 +1,13 @@
 # server/dashboard/plugin_loader.py
 import importlib.util
+import stat
 import sys
 import traceback
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, List, Dict, Any, Tuple
 import types
+from concurrent.futures import ThreadPoolExecutor
 
 # Toggle verbose tracebacks by setting ENV: DASHBOARD_DEBUG=1
 import os
@@ -23,8 +25,11 @@ DISABLE_ALL_PROPS = os.getenv("PLUGIN_DISABLE_ALL_PROPS", "0") == "1"
 PROPS_ALLOW = _csv_set("PLUGIN_PROPS_ALLOW")      # e.g. "tesla_hue_nest,thriller_hue_nest"
 PROPS_DISABLE = _csv_set("PLUGIN_PROPS_DISABLE")  # e.g. "example_prop"
 
+# In-process memo of discover_plugins results, keyed by roots + file signatures
+_DISCOVER_CACHE: Dict[tuple, Tuple[Dict, ...]] = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class PluginDesc:
     name: str
     layout: Callable[[], Any]
@@ -32,23 +37,40 @@ class PluginDesc:
     zone: str  # "card" | "topbar"
 
 
-def _load_module_from_path(name: str, file_path: str):
-    """Load a Python module from an arbitrary file path with a stable module name."""
+# module name -> (file_path, mtime_ns) of the last successful exec
+_LOADED: Dict[str, Tuple[str, int]] = {}
+
+
+def _load_module_from_path(name: str, file_path: str, mtime: int | None = None):
+    """Load a Python module from an arbitrary file path with a stable module name.
+
+    A module already loaded from the same, unmodified file is returned from
+    sys.modules instead of being executed again. Pass `mtime` (st_mtime_ns)
+    when the caller has already stat'ed the file.
+    """
+    if mtime is None:
+        mtime = os.stat(file_path).st_mtime_ns
+    existing = sys.modules.get(name)
+    if existing is not None and _LOADED.get(name) == (file_path, mtime):
+        return existing
     spec = importlib.util.spec_from_file_location(name, file_path)
     if spec is None or spec.loader is None:
         raise ImportError(f"Cannot create spec for {file_path}")
     mod = importlib.util.module_from_spec(spec)
     sys.modules[name] = mod
     spec.loader.exec_module(mod)
+    _LOADED[name] = (file_path, mtime)
     return mod
 
 
 def _validate_plugin(module, origin: Path) -> Tuple[PluginDesc | None, List[str]]:
     """Validate required symbols and types; return (PluginDesc or None, errors)."""
     errors: List[str] = []
-    # Required attributes
-    required = ["name", "layout", "register_callbacks"]
-    missing = [attr for attr in required if not hasattr(module, attr)]
+    # Required attributes; one look at the module namespace instead of a
+    # hasattr/getattr round trip per symbol
+    attrs = vars(module)
+    required = ("name", "layout", "register_callbacks")
+    missing = [attr for attr in required if attr not in attrs]
     if missing:
         errors.append(f"Missing required attribute(s): {', '.join(missing)}")
 
@@ -56,10 +78,10 @@ def _validate_plugin(module, origin: Path) -> Tuple[PluginDesc | None, List[str]
     if errors:
         return None, errors
 
-    name = getattr(module, "name")
-    layout = getattr(module, "layout")
-    register = getattr(module, "register_callbacks")
-    zone = getattr(module, "zone", "card")
+    name = attrs["name"]
+    layout = attrs["layout"]
+    register = attrs["register_callbacks"]
+    zone = attrs.get("zone", "card")
 
     # Type checks
     if not isinstance(name, str) or not name.strip():
@@ -77,9 +99,10 @@ def _validate_plugin(module, origin: Path) -> Tuple[PluginDesc | None, List[str]
     return PluginDesc(name=name, layout=layout, register=register, zone=zone), []
 
 
-def _try_load_one(module_name: str, file_path: Path) -> PluginDesc | None:
+def _try_load_one(module_name: str, file_path: Path, mtime: int | None = None) -> PluginDesc | None:
+    """Load and validate one plugin file; return its PluginDesc or None."""
     try:
-        m = _load_module_from_path(module_name, str(file_path))
+        m = _load_module_from_path(module_name, str(file_path), mtime)
     except Exception as e:
         print(f"[plugin_loader] Import failed for {file_path}: {e}")
         if DEBUG:
@@ -129,6 +152,10 @@ def _try_load_one(module_name: str, file_path: Path) -> PluginDesc | None:
     return desc
 
 
+def _sig(st: os.stat_result) -> List[int]:
+    return [st.st_mtime_ns, st.st_size]
+
+
 def _builtin_enabled(name: str) -> bool:
     """Check if builtin plugin is enabled via environment variables."""
     # Precedence: disable-all → allow-list (if set) → disable-list
@@ -153,38 +180,130 @@ def _prop_enabled(name: str) -> bool:
     return True
 
 
-def discover_plugins(props_root: str, builtins_root: str) -> List[Dict]:
+def _scan_builtins(builtins_root: str) -> List[Tuple[Path, List[int]]]:
+    """Return sorted (file, signature) for each <builtins_root>/*.py.
+
+    The file type comes from the scandir entry, so each file costs a
+    single stat for its signature.
+    """
+    found: List[Tuple[Path, List[int]]] = []
+    try:
+        with os.scandir(builtins_root) as it:
+            for entry in it:
+                # Deliberately skip dot-entries (editor lock/backup files); the
+                # old Path.glob matched them and could import such copies
+                if entry.name.endswith(".py") and not entry.name.startswith(".") and entry.is_file():
+                    found.append((Path(entry.path), _sig(entry.stat())))
+    except FileNotFoundError:
+        return []
+    found.sort()
+    return found
+
+
+def _scan_prop_pages(props_root: str) -> List[Tuple[str, Path, List[int]]]:
+    """Return sorted (prop_name, page, signature) for each <props_root>/<prop>/plugin/page.py.
+
+    One scandir pass plus one stat per directory, instead of a glob pattern
+    walk; that stat both tells a page exists and provides its signature.
+    """
+    found: List[Tuple[str, Path, List[int]]] = []
+    try:
+        with os.scandir(props_root) as it:
+            for entry in it:
+                # Deliberately skip dot-dirs (.git, .ipynb_checkpoints, ...),
+                # which the old Path.glob also matched
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                page = os.path.join(entry.path, "plugin", "page.py")
+                try:
+                    st = os.stat(page)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    found.append((entry.name, Path(page), _sig(st)))
+    except FileNotFoundError:
+        return []
+    found.sort()
+    return found
+
+
+def discover_plugins(props_root: str, builtins_root: str) -> Tuple[Dict, ...]:
     """
     Discover plugins from:
       - built-ins: <builtins_root>/*.py
       - props:     <props_root>/*/plugin/page.py
-    Returns a list of dicts as expected by app.py:
-      { "name", "layout", "register", "zone" }
+    Returns a tuple of dicts as expected by app.py:
+      { "name", "layout", "register", "zone", "origin" }
+    The tuple is shared with later calls for the same, unchanged files.
     """
+    builtin_files = _scan_builtins(builtins_root)
+    prop_pages = _scan_prop_pages(props_root)
+    sigs = {str(p): sig for p, sig in builtin_files}
+    sigs.update((str(page), sig) for _, page, sig in prop_pages)
+
+    # Nothing touched since the last call in this process: reuse its result
+    key = (props_root, builtins_root, tuple((path, *sig) for path, sig in sigs.items()))
+    cached = _DISCOVER_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     plugins: List[Dict] = []
 
+    # Collect (module_name, path, mtime_ns) jobs in the final plugin order
+    jobs: List[Tuple[str, Path, int]] = []
+
+    def _queue(module_name: str, path: Path):
+        jobs.append((module_name, path, sigs[str(path)][0]))
+
     # Built-in plugins
-    for f in sorted(Path(builtins_root).glob("*.py")):
+    for f, _ in builtin_files:
         plugin_name = f.stem
         if not _builtin_enabled(plugin_name):
             print(f"[plugin_loader] Skipping builtin plugin '{plugin_name}' (disabled by env)")
             continue
-        desc = _try_load_one(f"builtin_{plugin_name}", f)
-        if desc:
-            plugins.append({"name": desc.name, "layout": desc.layout, "register": desc.register, "zone": desc.zone})
+        _queue(f"builtin_{plugin_name}", f)
 
     # Prop plugins
-    for page in sorted(Path(props_root).glob("*/plugin/page.py")):
-        prop_name = page.parent.parent.name
+    for prop_name, page, _ in prop_pages:
         if not _prop_enabled(prop_name):
             print(f"[plugin_loader] Skipping prop plugin '{prop_name}' (disabled by env)")
             continue
-        mod_name = f"plugin_{prop_name}"
-        desc = _try_load_one(mod_name, page)
+        _queue(f"plugin_{prop_name}", page)
+
+    # Imports overlap their file I/O and top-level plugin work in threads;
+    # map() keeps results in job order. Serial in debug so output and
+    # tracebacks stay readable.
+    if DEBUG or len(jobs) < 2:
+        results = [_try_load_one(*job) for job in jobs]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs)), thread_name_prefix="plugin-load") as pool:
+            results = list(pool.map(lambda job: _try_load_one(*job), jobs))
+
+    for (_, path, _), desc in zip(jobs, results):
         if desc:
-            plugins.append({"name": desc.name, "layout": desc.layout, "register": desc.register, "zone": desc.zone})
+            plugins.append({"name": desc.name, "layout": desc.layout, "register": desc.register,
+                            "zone": desc.zone, "origin": str(path)})
 
     if not plugins:
         print("[plugin_loader] No plugins found. Expected /app/builtin_plugins/*.py or /opt/props/*/plugin/page.py")
 
+    result = _DISCOVER_CACHE[key] = tuple(plugins)
+    return result
+
+
+def discover_and_register(app, services: Dict[str, Any], props_root: str, builtins_root: str) -> Tuple[Dict, ...]:
+    """
+    Discover plugins (see discover_plugins) and register their callbacks
+    with `app` in one pass. A plugin whose registration fails is reported
+    once with its originating file and stays in the returned tuple, so its
+    layout is still mounted.
+    """
+    plugins = discover_plugins(props_root, builtins_root)
+    for p in plugins:
+        try:
+            p["register"](app, services)
+        except Exception as e:
+            print(f"[plugin_loader] register_callbacks failed for '{p['name']}' ({p['origin']}): {e}")
+            if DEBUG:
+                traceback.print_exc()
     return plugins
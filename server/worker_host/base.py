@@ -1,11 +1,31 @@
 from __future__ import annotations
-import asyncio, json, os, re
+import asyncio, json, logging, os, sys
 from dataclasses import dataclass
 from typing import Any, Callable, Optional, Protocol, Iterable, Union
 import inspect
 from pydantic import BaseModel
 
-@dataclass
+try:
+    import orjson
+    _loads = orjson.loads  # accepts bytes directly
+
+    def _dumps(obj) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # orjson is stricter than json (non-str dict keys, ints beyond
+            # 64 bits); keep accepting everything json.dumps did
+            return json.dumps(obj)
+except ImportError:  # optional speed-up; fall back to the stdlib codec
+    _loads = json.loads
+    _dumps = json.dumps
+
+_log = logging.getLogger(__name__)
+
+# `a/b` actions map to `do_a_b` handlers
+_SLASH_TO_UNDERSCORE = str.maketrans("/", "_")
+
+@dataclass(slots=True, frozen=True)
 class MqttMessage:
     topic: str
     payload: bytes
@@ -31,46 +51,61 @@ class BaseWorker:
         self.mqtt = mqtt
         self.config = config or {}
         self._tasks: list[asyncio.Task] = []
+        # Topics are fixed per prop; build them once instead of per message
+        base = f"halloween/{prop_id}"
+        # interned; on_message tries an identity check before the == compare
+        self._cmd_topic = sys.intern(f"{base}/cmd")
+        self._availability_topic = f"{base}/availability"
+        self._state_topic = f"{base}/state"
+        self._telemetry_prefix = f"{base}/telemetry/"
+        self._status_prefix = f"{base}/status/"
+        # action -> (bound do_<action> method, is_async); built on first
+        # message so subclasses have finished __init__
+        self._handlers: Optional[dict[str, tuple[Callable[..., Any], bool]]] = None
+        self._do_command: Optional[tuple[Callable[..., Any], bool]] = None
 
     # --- Lifecycle ---
     async def start(self) -> None:
-        self.mqtt.subscribe(f"halloween/{self.prop_id}/cmd", qos=1)
+        self.mqtt.subscribe(self._cmd_topic, qos=1)
         # Publish a simple availability LWT topic (no 'status' segment) so the
         # dashboard and other consumers can subscribe to `halloween/<prop_id>/availability`.
-        self.mqtt.publish(f"halloween/{self.prop_id}/availability", "online", qos=1, retain=True)
+        self.mqtt.publish(self._availability_topic, "online", qos=1, retain=True)
         # announce state
         self.publish_state("started", qos=1, retain=True)
 
     async def stop(self) -> None:
         for t in self._tasks:
             t.cancel()
-        self.mqtt.publish(f"halloween/{self.prop_id}/availability", "offline", qos=1, retain=True)
+        self.mqtt.publish(self._availability_topic, "offline", qos=1, retain=True)
         # announce state
         self.publish_state("stopped", qos=1, retain=True)
 
     # --- Message dispatch (parse action from payload) ---
     async def on_message(self, msg: MqttMessage) -> None:
-        if msg.topic != f"halloween/{self.prop_id}/cmd":
+        topic = msg.topic
+        if topic is not self._cmd_topic and topic != self._cmd_topic:
             return
         action, arg = self._parse_cmd_payload(msg.payload)
         if not action:
             self.publish_status("warn", "Empty/invalid command payload")
             return
-        handler_name = f"do_{action.replace('/', '_')}"
-        if hasattr(self, handler_name):
-            handler = getattr(self, handler_name)
+        if self._handlers is None:
+            self._build_handlers()
+        entry = self._handlers.get(action if "/" not in action else action.translate(_SLASH_TO_UNDERSCORE))
+        if entry is not None:
+            handler, is_async = entry
             try:
                 # If handler is async, await it; if it's sync, run in thread to avoid blocking loop
-                if inspect.iscoroutinefunction(handler):
+                if is_async:
                     await handler(arg)
                 else:
                     await asyncio.to_thread(handler, arg)
             except Exception as e:
                 self.publish_status("error", f"{type(e).__name__}: {e}")
-        elif hasattr(self, "do_command"):
-            handler = getattr(self, "do_command")
+        elif self._do_command is not None:
+            handler, is_async = self._do_command
             try:
-                if inspect.iscoroutinefunction(handler):
+                if is_async:
                     await handler(action, arg)
                 else:
                     await asyncio.to_thread(handler, action, arg)
@@ -79,6 +114,18 @@ class BaseWorker:
         else:
             self.publish_status("warn", f"Unknown action: {action}")
 
+    def _build_handlers(self) -> None:
+        """Collect `do_<action>` handlers once, with their sync/async kind."""
+        handlers: dict[str, tuple[Callable[..., Any], bool]] = {}
+        for attr in dir(self):
+            if attr.startswith("do_") and attr != "do_command":
+                m = getattr(self, attr)
+                if callable(m):
+                    handlers[attr[3:]] = (m, inspect.iscoroutinefunction(m))
+        do_command = getattr(self, "do_command", None)
+        self._do_command = (do_command, inspect.iscoroutinefunction(do_command)) if callable(do_command) else None
+        self._handlers = handlers
+
     # --- Helpers for workers ---
     def spawn(self, coro) -> None:
         self._tasks.append(asyncio.create_task(coro))
@@ -131,10 +178,9 @@ class BaseWorker:
             return default
 
         if isinstance(value, str):
-            # Check for ${VAR_NAME} pattern
-            match = re.match(r'^\$\{(.+)\}$', value)
-            if match:
-                env_var_name = match.group(1)
+            # Check for ${VAR_NAME} pattern with plain string tests; no regex
+            if len(value) >= 4 and value.startswith("${") and value.endswith("}"):
+                env_var_name = value[2:-1]
                 env_value = os.getenv(env_var_name)
                 # Return the environment value if it exists, otherwise the default
                 return env_value if env_value is not None else default
@@ -143,11 +189,13 @@ class BaseWorker:
         return value
 
     def telemetry(self, key: str, value: Any, qos: int = 0, retain: bool = False) -> None:
-        self.mqtt.publish(f"halloween/{self.prop_id}/telemetry/{key}", str(value), qos=qos, retain=retain)
-        print(f"telemetry: halloween/{self.prop_id}/telemetry/{key}={value}")
+        topic = self._telemetry_prefix + key
+        self.mqtt.publish(topic, str(value), qos=qos, retain=retain)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("telemetry: %s=%s", topic, value)
 
     def publish_status(self, key: str, value: Any, qos: int = 0, retain: bool = False) -> None:
-        self.mqtt.publish(f"halloween/{self.prop_id}/status/{key}", str(value), qos=qos, retain=retain)
+        self.mqtt.publish(self._status_prefix + key, str(value), qos=qos, retain=retain)
 
     def publish_state(self, state: str, qos: int = 0, retain: bool = False) -> None:
         """Publish a simple textual state for the worker under
@@ -159,7 +207,7 @@ class BaseWorker:
             retain: whether to retain the state message
         """
         try:
-            self.mqtt.publish(f"halloween/{self.prop_id}/state", str(state), qos=qos, retain=retain)
+            self.mqtt.publish(self._state_topic, str(state), qos=qos, retain=retain)
         except Exception:
             # Ensure worker doesn't crash due to publish errors
             print(f"[worker_host] failed to publish state for {self.prop_id}: {state}")
@@ -170,13 +218,19 @@ class BaseWorker:
         topic: halloween/<target_prop>/cmd
         payload: JSON {"action": ..., "args": ...}
         """
-        payload = json.dumps({"action": action, "args": args})
+        payload = _dumps({"action": action, "args": args})
         self.mqtt.publish(f"halloween/{target_prop}/cmd", payload, qos=qos)
 
     def broadcast(self, targets: Iterable[str], action: str, args: Any | None = None, *, qos: int = 1):
         """Send the same command to many props."""
+        targets = tuple(targets)  # may be a generator; also lets us skip empty
+        if not targets:
+            return
+        # The payload is identical for every target; encode it once
+        payload = _dumps({"action": action, "args": args})
+        publish = self.mqtt.publish
         for t in targets:
-            self.command(t, action, args, qos=qos)
+            publish(f"halloween/{t}/cmd", payload, qos=qos)
 
 
     @staticmethod
@@ -216,19 +270,21 @@ class BaseWorker:
         p = payload.decode("utf-8", errors="ignore").strip()
         if not p:
             return None, None
-        # Try JSON first
-        try:
-            obj = json.loads(p)
-            if isinstance(obj, dict) and "action" in obj:
-                action = str(obj["action"]).strip()
-                arg = obj.get("args")
-                if isinstance(arg, (dict, list)):
-                    arg = json.dumps(arg)
-                elif arg is not None:
-                    arg = str(arg)
-                return action, arg
-        except Exception:
-            pass
+        # Try JSON first; only an object can carry an action, so plain text
+        # never enters (and fails in) the parser
+        if p[0] == "{":
+            try:
+                obj = _loads(p)
+                if isinstance(obj, dict) and "action" in obj:
+                    action = str(obj["action"]).strip()
+                    arg = obj.get("args")
+                    if isinstance(arg, (dict, list)):
+                        arg = _dumps(arg)
+                    elif arg is not None:
+                        arg = str(arg)
+                    return action, arg
+            except Exception:
+                pass
         # Plain text: "action arg..."
         if " " in p:
             action, arg = p.split(" ", 1)
@@ -22,13 +22,17 @@ class Worker(BaseWorker):
 
     async def _ticker(self):
         """Publish a counter every few seconds."""
+        loop = asyncio.get_running_loop()
         i = 0
         interval = int(self.config.get("tick_interval", 5))
+        # Sleep to a fixed schedule so publish time doesn't accumulate as drift
+        next_t = loop.time()
         try:
           while True:
               self.telemetry("tick", i)
               i += 1
-              await asyncio.sleep(interval)
+              next_t += interval
+              await asyncio.sleep(max(0, next_t - loop.time()))
         except asyncio.CancelledError:
           # Optional: cleanup hardware, close files, etc.
           raise
@@ -4,9 +4,13 @@ dedupe entries and write combined requirements to a target file.
 """
 from __future__ import annotations
 import os
+from functools import lru_cache
 from pathlib import Path
 import sys
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+@lru_cache(maxsize=None)
 def find_repo_root(start: Path) -> Path | None:
     """
     On host, the repo root contains both 'props' and 'server' directories.
@@ -16,7 +20,7 @@ def find_repo_root(start: Path) -> Path | None:
     if not found.
     """
     for p in (start, *start.parents):
-        if (p / "props").is_dir() and (p / "server").is_dir():
+        if os.path.isdir(os.path.join(p, "props")) and os.path.isdir(os.path.join(p, "server")):
             return p
     return None
 
@@ -26,41 +30,61 @@ if env_root:
     ROOT = Path(env_root)
 else:
     # Start from the script directory
-    start_dir = Path(__file__).resolve().parent
-    found = find_repo_root(start_dir)
+    found = find_repo_root(SCRIPT_DIR)
     if found:
         ROOT = found
     else:
         # fallback: keep previous heuristic (script was two levels down in repo)
-        ROOT = Path(__file__).resolve().parents[2]
+        ROOT = SCRIPT_DIR.parents[1]
 
 
 print(f"collect_requirements.py: Repo root: {ROOT}")
 # Adjust if you want a different output path
 out_path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("/tmp/combined-requirements.txt")
 
+# worker_host sits at server/worker_host in the repo and at worker_host in
+# the image (REPO_ROOT=/app); probe both known locations instead of walking
+# the whole tree.
 req_files = []
-req_files += list(ROOT.glob("**/worker_host/requirements.txt"))
-req_files += list(ROOT.glob("**/worker_host/builtin_workers/requirements.txt"))
-req_files += list((ROOT / "props").glob("*/backend/requirements.txt"))
+for host_dir in (ROOT / "server" / "worker_host", ROOT / "worker_host"):
+    for candidate in (host_dir / "requirements.txt", host_dir / "builtin_workers" / "requirements.txt"):
+        if candidate.is_file():
+            req_files.append(candidate)
+
+props_dir = ROOT / "props"
+try:
+    with os.scandir(props_dir) as it:
+        prop_dirs = sorted(e.path for e in it if e.is_dir())
+except FileNotFoundError:
+    prop_dirs = []
+for d in prop_dirs:
+    candidate = os.path.join(d, "backend", "requirements.txt")
+    if os.path.isfile(candidate):
+        req_files.append(Path(candidate))
 
-seen = {}
+seen: set[str] = set()
 lines = []
+log = []  # progress output, written in one go at the end
 for rf in req_files:
-    print(f"collect_requirements.py: Processing: {rf}")
-    if not rf.exists():
+    log.append(f"collect_requirements.py: Processing: {rf}")
+    try:
+        fh = rf.open("r", encoding="utf-8")
+    except FileNotFoundError:
         continue
-    for raw in rf.read_text().splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        key = line.split(";", 1)[0].strip()
-        if key in seen:
-            continue
-        seen[key] = line
-        lines.append(line)
-        print(f"  + {line}  (from {rf})")
+    with fh:
+        for raw in fh:
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            key = line.split(";", 1)[0].strip()
+            if key in seen:
+                continue
+            seen.add(key)
+            lines.append(line)
+            log.append(f"  + {line}  (from {rf})")
+sys.stdout.write("\n".join(log) + "\n")
 
 out_path.parent.mkdir(parents=True, exist_ok=True)
-out_path.write_text("\n".join(sorted(lines)) + "\n")
+with out_path.open("w", encoding="utf-8") as fh:
+    fh.writelines(f"{ln}\n" for ln in sorted(lines))
 print(f"Wrote combined requirements to: {out_path}")
\ No newline at end of file
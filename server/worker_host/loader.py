@@ -3,16 +3,16 @@ from __future__ import annotations
 import importlib.util, os, sys, traceback, importlib
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Type, Optional
+from typing import Callable, List, Type, Optional
 import types
 from pydantic import BaseModel
 from .base import BaseWorker
 
 DEBUG = os.getenv("WORKER_DEBUG", "0") == "1"
 
-def _csv_set(envname: str) -> set[str]:
+def _csv_set(envname: str) -> frozenset[str]:
     v = os.getenv(envname, "")
-    return {s.strip() for s in v.split(",") if s.strip()}
+    return frozenset(s.strip() for s in v.split(",") if s.strip())
 
 DISABLE_ALL_BUILTINS = os.getenv("WORKER_DISABLE_ALL_BUILTINS", "0") == "1"
 BUILTINS_ALLOW = _csv_set("WORKER_BUILTINS_ALLOW")      # e.g. "heartbeat,smoketest"
@@ -22,7 +22,7 @@ DISABLE_ALL_PROPS = os.getenv("WORKER_DISABLE_ALL_PROPS", "0") == "1"
 PROPS_ALLOW = _csv_set("WORKER_PROPS_ALLOW")      # e.g. "coffin_jumper,tesla_hue_nest"
 PROPS_DISABLE = _csv_set("WORKER_PROPS_DISABLE")  # e.g. "example_prop"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkerDesc:
     prop_id: str
     cls: Type[BaseWorker]
@@ -31,6 +31,18 @@ class WorkerDesc:
     config_model: Optional[Type[BaseModel]]
 
 
+# Roots already checked against sys.path; each is scanned for at most once
+_sys_path_primed: set[str] = set()
+
+def _prime_sys_path(root: str) -> None:
+    """Put `root` at the front of sys.path unless already present."""
+    if root in _sys_path_primed:
+        return
+    _sys_path_primed.add(root)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+
 def _load_module_from_path(name: str, file_path: Path):
     """
     Load a python module from file_path.
@@ -67,10 +79,7 @@ def _load_module_from_path(name: str, file_path: Path):
     package_init = backend_dir / "__init__.py"
     if package_init.exists():
         # ensure repo root (parent of 'props') is on sys.path so importlib can find 'props'
-        repo_root = Path(props_dir).parent
-        repo_root_str = str(repo_root)
-        if repo_root_str not in sys.path:
-            sys.path.insert(0, repo_root_str)
+        _prime_sys_path(str(Path(props_dir).parent))
 
         if props_dir.name == "props":
             pkg_base = f"props.{prop_pkg}.backend"
@@ -128,20 +137,6 @@ def _validate_worker(module, origin: Path) -> Optional[Type[BaseWorker]]:
         return None
     return Worker
 
-def _maybe_prop_id_from_builtin(worker_py: Path) -> str:
-    # Allow an explicit PROP_ID variable in builtin modules; fallback to filename.
-    try:
-        txt = worker_py.read_text(encoding="utf-8", errors="ignore")
-        for line in txt.splitlines():
-            if line.strip().startswith("PROP_ID"):
-                # naive parse: PROP_ID = "foo"
-                val = line.split("=", 1)[1].strip().strip('"').strip("'")
-                if val:
-                    return val
-    except Exception:
-        pass
-    return worker_py.stem
-
 def _try_load_one(mod_name: str, worker_py: Path, prop_id_hint: Optional[str] = None) -> Optional[WorkerDesc]:
     try:
         m = _load_module_from_path(mod_name, worker_py)
@@ -149,11 +144,12 @@ def _try_load_one(mod_name: str, worker_py: Path, prop_id_hint: Optional[str] =
         if not cls:
             return None
 
-        # Discover config file
-        cfg_json = worker_py.with_name("config.json")
-        cfg_yaml = worker_py.with_name("config.yaml")
-        cfg_yml  = worker_py.with_name("config.yml")
-        config_path = next((p for p in [cfg_json, cfg_yaml, cfg_yml] if p.exists()), None)
+        # Discover config file; one listing of the backend dir instead of an
+        # exists() probe per candidate name
+        backend_dir = worker_py.parent
+        with os.scandir(backend_dir) as it:
+            names = {e.name for e in it}
+        config_path = next((backend_dir / c for c in ("config.json", "config.yaml", "config.yml") if c in names), None)
 
         # Discover Pydantic config model
         ConfigModel = getattr(m, "ConfigModel", None)
@@ -178,26 +174,19 @@ def _try_load_one(mod_name: str, worker_py: Path, prop_id_hint: Optional[str] =
             traceback.print_exc()
         return None
 
-def _builtin_enabled(name: str) -> bool:
+def _make_enabled(disable_all: bool, allow: frozenset[str], disable: frozenset[str]) -> Callable[[str], bool]:
+    """Pick the enable check once at import; the env lists never change."""
     # Precedence: disable-all → allow-list (if set) → disable-list
-    if DISABLE_ALL_BUILTINS:
-        return False
-    if BUILTINS_ALLOW:
-        return name in BUILTINS_ALLOW
-    if BUILTINS_DISABLE:
-        return name not in BUILTINS_DISABLE
-    return True
-
-def _prop_enabled(name: str) -> bool:
-    """Check if prop worker is enabled via environment variables."""
-    # Precedence: disable-all → allow-list (if set) → disable-list
-    if DISABLE_ALL_PROPS:
-        return False
-    if PROPS_ALLOW:
-        return name in PROPS_ALLOW
-    if PROPS_DISABLE:
-        return name not in PROPS_DISABLE
-    return True
+    if disable_all:
+        return lambda name: False
+    if allow:
+        return allow.__contains__
+    if disable:
+        return lambda name: name not in disable
+    return lambda name: True
+
+_builtin_enabled = _make_enabled(DISABLE_ALL_BUILTINS, BUILTINS_ALLOW, BUILTINS_DISABLE)
+_prop_enabled = _make_enabled(DISABLE_ALL_PROPS, PROPS_ALLOW, PROPS_DISABLE)
 
 def discover_workers(props_root: Path, builtin_root: Optional[Path] = None) -> List[WorkerDesc]:
     workers: List[WorkerDesc] = []
@@ -205,18 +194,25 @@ def discover_workers(props_root: Path, builtin_root: Optional[Path] = None) -> L
     # Ensure repo root (parent of props_root) is on sys.path so package imports work.
     # This makes importlib.import_module("props.<prop>.backend.worker") possible.
     try:
-        repo_root = Path(props_root).resolve().parent
-        repo_root_str = str(repo_root)
-        if repo_root_str not in sys.path:
-            sys.path.insert(0, repo_root_str)
+        _prime_sys_path(str(Path(props_root).resolve().parent))
     except Exception:
         pass
 
     # Built-ins (optional)
-    if builtin_root and builtin_root.exists():
-        for wf in sorted(builtin_root.glob("*.py")):
-            if wf.name.startswith("_"):
-                continue
+    if builtin_root:
+        try:
+            # Sort bare names and skip private modules during the scan. Dot-files
+            # are skipped on purpose too (the old Path.glob matched them), so
+            # editor lock/backup copies are never imported as workers.
+            with os.scandir(builtin_root) as it:
+                builtin_names = sorted(
+                    e.name for e in it
+                    if e.name.endswith(".py") and not e.name.startswith(("_", ".")) and e.is_file()
+                )
+        except FileNotFoundError:
+            builtin_names = []
+        for fname in builtin_names:
+            wf = builtin_root / fname
             builtin_name = wf.stem  # e.g., "heartbeat"
             if not _builtin_enabled(builtin_name):
                 print(f"[worker_loader] Skipping builtin '{builtin_name}' (disabled by env)")
@@ -226,9 +222,19 @@ def discover_workers(props_root: Path, builtin_root: Optional[Path] = None) -> L
             if desc:
                 workers.append(desc)
 
-    # Prop backends
-    for worker_py in sorted(Path(props_root).glob("*/backend/worker.py")):
-        prop_name = worker_py.parent.parent.name
+    # Prop backends: one scandir of props_root, then a direct probe per prop
+    # for the fixed backend/worker.py path. Dot-dirs (.git, checkpoints) are
+    # deliberately skipped; the old Path.glob matched them.
+    try:
+        with os.scandir(props_root) as it:
+            prop_names = sorted(e.name for e in it if not e.name.startswith(".") and e.is_dir())
+    except FileNotFoundError:
+        prop_names = []
+    for prop_name in prop_names:
+        candidate = os.path.join(props_root, prop_name, "backend", "worker.py")
+        if not os.path.isfile(candidate):
+            continue
+        worker_py = Path(candidate)
         if not _prop_enabled(prop_name):
             print(f"[worker_loader] Skipping prop '{prop_name}' (disabled by env)")
             continue
@@ -1,6 +1,8 @@
 from __future__ import annotations
 import asyncio
+import importlib
 import json
+import logging
 import os
 import signal
 import time
@@ -15,6 +17,27 @@ PROPS_ROOT = Path("/app/props")  # bind-mounted repo
 BUILTIN_ROOT = Path("/app/worker_host/builtin_workers")  # optional
 WORKER_LWT = "halloween/worker_host/availability"
 UPTIME_TOPIC = "halloween/worker_host/uptime"
+MSG_QUEUE_MAX = 1024  # inbound messages buffered for the dispatcher
+DROP_WARN_INTERVAL = 10.0  # seconds between "queue full" warnings
+
+log = logging.getLogger(__name__)
+
+class _LazyModule:
+    """Module proxy that imports the real module on first attribute access."""
+    __slots__ = ("_name", "_mod")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._mod = None
+
+    def __getattr__(self, attr: str):
+        mod = self._mod
+        if mod is None:
+            mod = self._mod = importlib.import_module(self._name)
+        return getattr(mod, attr)
+
+# Only needed when a worker ships a YAML config
+yaml = _LazyModule("yaml")
 
 def env(name: str, default: str | None = None, required: bool = False) -> str:
     val = os.getenv(name, default)
@@ -33,7 +56,6 @@ def _load_config(desc: WorkerDesc) -> dict | None:
             if desc.config_path.suffix.lower() == ".json":
                 return json.loads(raw_config_text)
             elif desc.config_path.suffix.lower() in (".yaml", ".yml"):
-                import yaml
                 return yaml.safe_load(raw_config_text) or {}
             else:
                 print(f"[worker_host] Unknown config format for {desc.config_path}")
@@ -41,7 +63,6 @@ def _load_config(desc: WorkerDesc) -> dict | None:
 
         # If a Pydantic model is defined, use it to parse
         if desc.config_path.suffix.lower() in (".yaml", ".yml"):
-            import yaml
             raw_dict = yaml.safe_load(raw_config_text) or {}
             # Let the worker's ConfigModel (now a BaseSettings subclass)
             # resolve missing values from the environment. Validate directly.
@@ -86,10 +107,36 @@ async def run():
 
     # Fan-out setup
     loop = asyncio.get_running_loop()
-    msg_queue: asyncio.Queue[MqttMessage] = asyncio.Queue()
+    # Bounded so a message storm during a slow on_message can't grow memory
+    # without limit; when full the oldest message is dropped.
+    msg_queue: asyncio.Queue[MqttMessage] = asyncio.Queue(maxsize=MSG_QUEUE_MAX)
+
+    # Dropped messages are mostly QoS 1 commands; report them (at most once
+    # per DROP_WARN_INTERVAL) so an overloaded dispatcher is visible.
+    drops = {"count": 0, "last_warn": 0.0}
+
+    def _enqueue(msg: MqttMessage) -> None:
+        try:
+            msg_queue.put_nowait(msg)
+        except asyncio.QueueFull:
+            try:
+                dropped = msg_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                dropped = None
+            msg_queue.put_nowait(msg)
+            if dropped is not None:
+                drops["count"] += 1
+                now = time.monotonic()
+                if now - drops["last_warn"] >= DROP_WARN_INTERVAL:
+                    log.warning(
+                        "Message queue full (%d); dropped %d message(s), latest on %s",
+                        MSG_QUEUE_MAX, drops["count"], dropped.topic,
+                    )
+                    drops["count"] = 0
+                    drops["last_warn"] = now
 
     def on_any_message(msg: MqttMessage) -> None:
-        loop.call_soon_threadsafe(msg_queue.put_nowait, msg)
+        loop.call_soon_threadsafe(_enqueue, msg)
 
     mqtt.add_message_handler(on_any_message)
 
@@ -101,14 +148,20 @@ async def run():
         await w.start()
         instances[desc.prop_id] = w
 
+    # The worker set is fixed from here on; the dispatcher rejects topics for
+    # unknown props with one membership test
+    known = frozenset(instances)
+
     # One subscription for all control topics; workers filter locally
     mqtt.subscribe("halloween/+/cmd", qos=1)
 
     # Heartbeat
     async def heartbeat():
-        start = time.time()
+        # monotonic so wall-clock jumps (NTP sync) don't skew the uptime
+        start = time.monotonic()
+        publish = mqtt.publish
         while True:
-            mqtt.publish(UPTIME_TOPIC, str(int(time.time() - start)), qos=0)
+            publish(UPTIME_TOPIC, b"%d" % int(time.monotonic() - start), qos=0)
             await asyncio.sleep(10)
     hb_task = asyncio.create_task(heartbeat())
 
@@ -116,12 +169,21 @@ async def run():
     async def dispatcher():
         while True:
             msg = await msg_queue.get()
-            parts = msg.topic.split("/", 3)
-            if len(parts) >= 3 and parts[0] == "halloween":
-                prop_id = parts[1]
-                w = instances.get(prop_id)
-                if w:
-                    await w.on_message(msg)
+            # Drain whatever else is already queued before awaiting again
+            while True:
+                # halloween/<prop_id>/...: slice the prop id out without
+                # splitting the topic into a list
+                t = msg.topic
+                if t.startswith("halloween/"):
+                    end = t.find("/", 10)
+                    if end > 10:
+                        prop_id = t[10:end]
+                        if prop_id in known:
+                            await instances[prop_id].on_message(msg)
+                try:
+                    msg = msg_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
     disp_task = asyncio.create_task(dispatcher())
 
     # Graceful shutdown
@@ -139,6 +201,18 @@ async def run():
             pass
 
 def main():
+    # Workers log their chatty per-tick/per-command output at DEBUG; keep the
+    # default quiet and let LOG_LEVEL turn it up when troubleshooting.
+    level_name = env("LOG_LEVEL", "WARNING").upper() or "WARNING"
+    # getLevelName maps known names to their int level, anything else to a str
+    level = logging.getLevelName(level_name)
+    bad_level = not isinstance(level, int)
+    logging.basicConfig(
+        level=logging.WARNING if bad_level else level,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    if bad_level:
+        log.warning("Unknown LOG_LEVEL %r; using WARNING", level_name)
     asyncio.run(run())
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import threading
-from typing import Callable, List
+from typing import Callable
 import paho.mqtt.client as mqtt
 
 from .base import MqttMessage
@@ -18,7 +18,9 @@ class ThreadedMqtt:
         if lwt_topic:
             self._client.will_set(lwt_topic, payload="offline", qos=1, retain=True)
 
-        self._handlers: List[Callable[[MqttMessage], None]] = []
+        # Immutable snapshot, replaced on add; the network thread iterates it
+        # without copying or locking
+        self._handlers: tuple[Callable[[MqttMessage], None], ...] = ()
 
         self._client.on_message = self._on_message
         self._client.on_connect = self._on_connect
@@ -36,7 +38,7 @@ class ThreadedMqtt:
         self._client.subscribe(topic, qos=qos)
 
     def add_message_handler(self, handler: Callable[[MqttMessage], None]) -> None:
-        self._handlers.append(handler)
+        self._handlers = self._handlers + (handler,)
 
     # Lifecycle
     def connect_and_loop(self) -> None:
@@ -54,7 +56,7 @@ class ThreadedMqtt:
 
     def _on_message(self, client, userdata, message):
         msg = MqttMessage(topic=message.topic, payload=message.payload, qos=message.qos, retain=message.retain)
-        for h in list(self._handlers):
+        for h in self._handlers:
             try:
                 h(msg)
             except Exception: